@@ -1,8 +1,10 @@
 """Data upload and retrieval API routes."""
 
 import logging
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException, UploadFile, File
+from functools import lru_cache
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
@@ -29,6 +31,29 @@ def _get_default_data() -> pd.DataFrame:
     return _default_data
 
 
+def _depth_slice(
+    df: pd.DataFrame,
+    min_depth: Optional[float] = None,
+    max_depth: Optional[float] = None,
+) -> pd.DataFrame:
+    """Slice a DEPTH-sorted frame to [min_depth, max_depth].
+
+    load_data guarantees the frame is sorted by DEPTH, so a binary search
+    plus contiguous iloc slice replaces the O(N) boolean mask and the
+    gathered copy it implies.
+    """
+    if min_depth is None and max_depth is None:
+        return df
+    depth = df["DEPTH"].values
+    lo = 0 if min_depth is None else int(np.searchsorted(depth, min_depth, side="left"))
+    hi = (
+        len(depth)
+        if max_depth is None
+        else int(np.searchsorted(depth, max_depth, side="right"))
+    )
+    return df.iloc[lo:hi]
+
+
 class SampleDataResponse(BaseModel):
     columns: List[str]
     rows: int
@@ -55,6 +80,48 @@ class ValidateResponse(BaseModel):
     depth_range: Dict[str, Any]
 
 
+@lru_cache(maxsize=32)
+def _sample_slice(
+    min_depth: Optional[float], max_depth: Optional[float]
+) -> pd.DataFrame:
+    """Memoize the depth slice for a (min_depth, max_depth) pair.
+
+    The default dataset is immutable after load, so the binary-search
+    slice can be cached per distinct range. Only the slice is cached —
+    it shares the parent frame's blocks, whereas memoizing the
+    serialized to_dict payload (tens of MB per entry on large ranges)
+    would pin hundreds of MB of dicts for the process lifetime.
+    """
+    return _depth_slice(_get_default_data(), min_depth, max_depth)
+
+
+def _sample_payload(
+    min_depth: Optional[float], max_depth: Optional[float]
+) -> Dict[str, Any]:
+    """Build the /data/sample payload for a depth range."""
+    df = _sample_slice(min_depth, max_depth)
+
+    # Return ALL columns so ML models can use all features
+    preview = df.to_dict(orient="records")
+
+    # Slice is DEPTH-sorted, so the range is the first/last element —
+    # no full-column min/max scan needed.
+    if len(df):
+        depth_range = {
+            "min": float(df["DEPTH"].iat[0]),
+            "max": float(df["DEPTH"].iat[-1]),
+        }
+    else:
+        depth_range = {"min": float("nan"), "max": float("nan")}
+
+    return {
+        "columns": list(df.columns),
+        "rows": len(df),
+        "data": preview,
+        "depth_range": depth_range,
+    }
+
+
 @router.get("/data/sample", response_model=SampleDataResponse)
 async def get_sample_data(
     min_depth: Optional[float] = None,
@@ -62,24 +129,7 @@ async def get_sample_data(
 ):
     """Get the default dataset with optional depth filtering."""
     try:
-        df = _get_default_data()
-        if min_depth is not None:
-            df = df[df["DEPTH"] >= min_depth]
-        if max_depth is not None:
-            df = df[df["DEPTH"] <= max_depth]
-
-        # Return ALL columns so ML models can use all features
-        preview = df.to_dict(orient="records")
-
-        return {
-            "columns": list(df.columns),
-            "rows": len(df),
-            "data": preview,
-            "depth_range": {
-                "min": float(df["DEPTH"].min()),
-                "max": float(df["DEPTH"].max()),
-            },
-        }
+        return _sample_payload(min_depth, max_depth)
     except Exception as e:
         logger.error(f"Failed to get sample data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
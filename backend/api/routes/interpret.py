@@ -36,7 +36,9 @@ def _df_from_request(req: InterpretRequest) -> pd.DataFrame:
         mask = (df["DEPTH"] >= req.depth_range.get("min", -np.inf)) & (
             df["DEPTH"] <= req.depth_range.get("max", np.inf)
         )
-        df = df[mask].copy()
+        # Read-only downstream (predict/interpret never mutate), so the
+        # masked view is enough — no defensive copy.
+        df = df[mask]
     return df
 
 
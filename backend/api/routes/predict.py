@@ -30,6 +30,8 @@ class _StubModelManager:
         raise RuntimeError("ModelManager unavailable — models not loaded yet.")
     def predict_pressure(self, df):
         raise RuntimeError("ModelManager unavailable — models not loaded yet.")
+    def predict_all(self, df):
+        raise RuntimeError("ModelManager unavailable — models not loaded yet.")
 
 
 def _load_manager():
@@ -37,8 +39,10 @@ def _load_manager():
     global _manager
     if _manager is None:
         try:
-            from backend.services.model_manager import ModelManager  # noqa: PLC0415
-            _manager = ModelManager()
+            # Shared process-wide instance: the startup thread or another
+            # route may already have paid the unpickling cost.
+            from backend.services.model_manager import get_model_manager  # noqa: PLC0415
+            _manager = get_model_manager()
         except Exception as exc:
             logger.error("ModelManager unavailable: %s", exc)
             _manager = _StubModelManager()
@@ -88,7 +92,9 @@ def _df_from_request(req: PredictRequest) -> pd.DataFrame:
         mask = (df["DEPTH"] >= req.depth_range.get("min", -np.inf)) & (
             df["DEPTH"] <= req.depth_range.get("max", np.inf)
         )
-        df = df[mask].copy()
+        # Read-only downstream (predict/interpret never mutate), so the
+        # masked view is enough — no defensive copy.
+        df = df[mask]
     return df
 
 
@@ -150,28 +156,21 @@ async def predict_all(req: PredictRequest):
         mgr = get_manager()
         df = _df_from_request(req)
 
-        try:
-            p = mgr.predict_porosity(df)
-            result.porosity = PorosityResponse(predictions=p.tolist())
-        except Exception as e:
-            logger.warning("Porosity prediction failed: %s", e)
+        # One shared feature-selection/NaN-fill pass for all three models.
+        preds = mgr.predict_all(df)
 
-        try:
-            preds, proba = mgr.predict_fluid(df)
+        if preds["porosity"] is not None:
+            result.porosity = PorosityResponse(predictions=preds["porosity"].tolist())
+
+        if preds["fluid"] is not None:
             result.fluid = FluidResponse(
-                predictions=preds.tolist(),
-                probabilities=proba.tolist(),
+                predictions=preds["fluid"].tolist(),
+                probabilities=preds["fluid_proba"].tolist(),
                 classes=["Background", "Potential Reservoir", "Pay Zone"],
             )
-        except Exception as e:
-            logger.warning("Fluid prediction failed: %s", e)
 
-        try:
-            p = mgr.predict_pressure(df)
-            if p is not None:
-                result.pressure = PressureResponse(predictions=p.tolist())
-        except Exception as e:
-            logger.warning("Pressure prediction failed: %s", e)
+        if preds["pressure"] is not None:
+            result.pressure = PressureResponse(predictions=preds["pressure"].tolist())
 
     except RuntimeError as e:
         detail = f"Models not ready: {e} — run /api/v1/health before predictions"
@@ -58,8 +58,8 @@ def _load_manager():
     global _manager
     if _manager is None:
         try:
-            from backend.services.model_manager import ModelManager
-            _manager = ModelManager()
+            from backend.services.model_manager import get_model_manager
+            _manager = get_model_manager()
         except Exception as exc:
             logger.error("ModelManager unavailable: %s", exc)
             _manager = None
@@ -17,10 +17,10 @@ def _load_models_sync():
     global model_manager
     try:
         logger.info("Loading ML models...")
-        from backend.services.model_manager import ModelManager  # noqa: PLC0415
+        from backend.services.model_manager import get_model_manager  # noqa: PLC0415
 
         with _model_lock:
-            model_manager = ModelManager()
+            model_manager = get_model_manager()
         logger.info("Models loaded. Application ready.")
     except Exception as e:  # pragma: no cover
         logger.error(f"Failed to load models: {e}")
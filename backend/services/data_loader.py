@@ -4,11 +4,18 @@ Loads well-logging data from CSV, validates structure, sorts by depth,
 and computes missing target columns if not already present.
 """
 
+import hashlib
 import io
+import os
 import pandas as pd
 import logging
 from backend.core.config import settings
 
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - polars is an optional accelerator
+    pl = None
+
 logger = logging.getLogger(__name__)
 
 DISPLAY_COLS = [
@@ -25,33 +32,91 @@ DISPLAY_COLS = [
 TARGETS = ["PHI_COMBINED", "FLUID_CLASS", "PREDICTED_PORE_PRESSURE_PSI"]
 
 
+def _read_sorted_csv(path: str) -> pd.DataFrame:
+    """Read a CSV and return a DataFrame sorted by DEPTH.
+
+    Uses polars when available: its multi-threaded CSV parser and parallel
+    sort are considerably faster than pandas on the wide well-log files we
+    load, and the lazy scan fuses the read and sort into one pass. Falls
+    back to single-threaded pandas when polars is not installed.
+    """
+    if pl is not None:
+        lf = pl.scan_csv(path)
+        df_pl = lf.sort("DEPTH").collect()
+        return df_pl.to_pandas()
+
+    try:
+        # Multi-threaded Arrow parser; also skips pandas' two-pass dtype
+        # inference since Arrow types the columns during the read.
+        df = pd.read_csv(path, engine="pyarrow")
+    except (ImportError, ValueError):
+        df = pd.read_csv(path)
+    # In-place sort with ignore_index avoids the extra copy that
+    # sort_values().reset_index() chains through.
+    df.sort_values("DEPTH", inplace=True, ignore_index=True)
+    return df
+
+
+def _parquet_sidecar_path(csv_path: str) -> str:
+    """Return the Parquet cache path sitting next to the source CSV."""
+    root, _ = os.path.splitext(csv_path)
+    return root + ".parquet"
+
+
 def load_data():
-    """Load and validate default well-logging dataset."""
+    """Load and validate default well-logging dataset.
+
+    The parsed, sorted, target-complete dataset is cached to a Parquet
+    sidecar next to the CSV; subsequent loads deserialize the columnar
+    file directly (guarded by an mtime check) instead of reparsing CSV.
+    """
     from backend.services.targets import compute_all_targets
 
+    csv_path = str(settings.DATA_PATH)
+    pq_path = _parquet_sidecar_path(csv_path)
+
     try:
-        df = pd.read_csv(str(settings.DATA_PATH))
+        if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(
+            csv_path
+        ):
+            # Sort order and derived targets were persisted with the cache.
+            return pd.read_parquet(pq_path, engine="pyarrow")
+
+        df = _read_sorted_csv(csv_path)
 
         essential = ["DEPTH"] + [c for c in DISPLAY_COLS if c != "DEPTH"]
         missing = [col for col in essential if col not in df.columns]
         if missing:
             logger.warning(f"Missing essential columns: {missing}")
 
-        df = df.sort_values("DEPTH").reset_index(drop=True)
-
         missing_targets = [t for t in TARGETS if t not in df.columns]
         if missing_targets:
             df = compute_all_targets(df, inplace=True)
 
+        try:
+            df.to_parquet(pq_path, engine="pyarrow", compression="zstd")
+        except Exception as e:
+            logger.warning(f"Could not write Parquet cache {pq_path}: {e}")
+
         return df
 
     except Exception as e:
         raise RuntimeError(f"Failed to load data: {e}")
 
 
+# Parsed uploads memoized by content digest: the upload and validate
+# endpoints (and users re-clicking upload) routinely submit identical
+# bytes, and parsing plus target computation dominates those requests.
+_UPLOAD_CACHE_MAX = 8
+_upload_cache: dict = {}
+
+
 def load_uploaded_file(file_bytes: bytes, filename: str) -> pd.DataFrame:
     """Load data from uploaded file bytes (CSV or Excel).
 
+    Results are cached by (content digest, extension), so re-submitting
+    the same file skips the parse and derived-target passes entirely.
+
     Args:
         file_bytes: Raw file content.
         filename: Original filename (used to detect format).
@@ -61,24 +126,38 @@ def load_uploaded_file(file_bytes: bytes, filename: str) -> pd.DataFrame:
     """
     from backend.services.targets import compute_all_targets
 
+    cache_key = (hashlib.sha1(file_bytes).hexdigest(), filename.lower())
+    cached = _upload_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         if filename.lower().endswith(".csv"):
             df = pd.read_csv(io.BytesIO(file_bytes))
         elif filename.lower().endswith((".xlsx", ".xls")):
-            df = pd.read_excel(io.BytesIO(file_bytes))
+            try:
+                # Rust-based parser, an order of magnitude faster than the
+                # default openpyxl on large workbooks (pandas >= 2.2).
+                df = pd.read_excel(io.BytesIO(file_bytes), engine="calamine")
+            except (ImportError, ValueError):
+                df = pd.read_excel(io.BytesIO(file_bytes))
         else:
             raise ValueError(f"Unsupported file format: {filename}")
 
         if "DEPTH" not in df.columns:
             raise ValueError("Uploaded file must contain a 'DEPTH' column.")
 
-        df = df.sort_values("DEPTH").reset_index(drop=True)
+        df.sort_values("DEPTH", inplace=True, ignore_index=True)
 
         try:
             df = compute_all_targets(df, inplace=False)
         except Exception as e:
             logger.warning(f"Could not compute derived targets: {e}")
 
+        if len(_upload_cache) >= _UPLOAD_CACHE_MAX:
+            _upload_cache.pop(next(iter(_upload_cache)))
+        _upload_cache[cache_key] = df
+
         return df
 
     except Exception as e:
@@ -7,8 +7,10 @@ Manages loading, validation, and inference for three predictive models:
 """
 
 import logging
+import threading
 import joblib
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Fix for deprecated np.int in newer numpy versions
 if not hasattr(np, "int"):
@@ -25,7 +27,7 @@ MODEL_FLUID = settings.MODEL_DIR / settings.MODEL_FLUID
 MODEL_PRESSURE = settings.MODEL_DIR / settings.MODEL_PRESSURE
 ENCODER_FLUID = settings.MODEL_DIR / settings.ENCODER_FLUID
 
-FEATURES_POROSITY = [
+FEATURES_POROSITY = (
     "DEPTH",
     "Gamma Ray - Corrected gAPI",
     "Resistivity Phase - Corrected - 2MHz ohm.m",
@@ -34,9 +36,9 @@ FEATURES_POROSITY = [
     "Surface Torque Average N.m",
     "Weight On Bit N",
     "Chrom 1 Total Gas Euc",
-]
+)
 
-FEATURES_FLUID = [
+FEATURES_FLUID = (
     "DEPTH",
     "Gamma Ray - Corrected gAPI",
     "Corrected Drilling Exponent unitless",
@@ -45,9 +47,9 @@ FEATURES_FLUID = [
     "Surface Torque Average N.m",
     "Weight On Bit N",
     "28 Stick Slip RPM Average RPM",
-]
+)
 
-FEATURES_PRESSURE = [
+FEATURES_PRESSURE = (
     "DEPTH",
     "Mud Weight In kg/m3",
     "ECD at Bit kg/m3",
@@ -61,13 +63,43 @@ FEATURES_PRESSURE = [
     "P_Overburden",
     "Effective_Stress",
     "Pressure_Anomaly",
-]
+)
 
-MINIMAL_FEATURES = [
+MINIMAL_FEATURES = (
     "DEPTH",
     "Weight On Bit N",
     "ROP for the Bit - Distance Over Time (On Bottom) m/s",
-]
+)
+
+# Union of the three feature sets (order-preserving) plus per-model
+# positional index arrays into it, precomputed once so the batched
+# predict path selects columns by position instead of repeated
+# name-by-name lookups.
+FEATURES_UNION = tuple(
+    dict.fromkeys(FEATURES_POROSITY + FEATURES_FLUID + FEATURES_PRESSURE)
+)
+_POROSITY_IDX = np.array([FEATURES_UNION.index(f) for f in FEATURES_POROSITY])
+_FLUID_IDX = np.array([FEATURES_UNION.index(f) for f in FEATURES_FLUID])
+_PRESSURE_IDX = np.array([FEATURES_UNION.index(f) for f in FEATURES_PRESSURE])
+
+
+def _fast_predict(model, X: pd.DataFrame) -> np.ndarray:
+    """Predict through Booster.inplace_predict when the frame lines up.
+
+    inplace_predict on a contiguous float32 array skips the DMatrix
+    allocation/copy the sklearn wrapper performs per call. Falls back to
+    the wrapper's predict when the columns don't match the booster's
+    training features (e.g. the minimal-feature fallback path).
+    """
+    try:
+        booster = model.get_booster()
+        if booster.feature_names == list(X.columns):
+            return booster.inplace_predict(
+                np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+            )
+    except Exception:
+        pass
+    return model.predict(X)
 
 
 class ModelManager:
@@ -80,6 +112,19 @@ class ModelManager:
             self.fluid_model = joblib.load(str(MODEL_FLUID))
             self.pressure_model = joblib.load(str(MODEL_PRESSURE))
             self.fluid_encoder = joblib.load(str(ENCODER_FLUID))
+            # Memoized available-feature lists per (model, df schema);
+            # see _safe_select.
+            self._col_cache: dict = {}
+            # The pressure booster's training features, resolved once so
+            # predict_pressure doesn't traverse get_booster() per call.
+            # feature_names is None on boosters trained without names;
+            # guard like _fast_predict rather than fail construction.
+            self._pressure_features = tuple(
+                self.pressure_model.get_booster().feature_names or ()
+            )
+            # Training-set feature means for NaN imputation, if persisted
+            # alongside the model artifacts; see _fill_missing.
+            self._feature_means = self._load_feature_means()
             logger.info("All models loaded successfully")
         except FileNotFoundError as e:
             logger.error(f"Model file not found: {e}")
@@ -88,74 +133,180 @@ class ModelManager:
             logger.error(f"Failed to load models: {e}")
             raise
 
+    @staticmethod
+    def _load_feature_means() -> "pd.Series | None":
+        """Load persisted training-set feature means, if the sidecar exists.
+
+        Returns None when no sidecar is found, in which case imputation
+        falls back to per-batch means (the original behaviour).
+        """
+        means_path = settings.MODEL_DIR / "feature_means.json"
+        try:
+            if means_path.exists():
+                return pd.read_json(means_path, typ="series")
+        except Exception as e:
+            logger.warning(f"Could not load feature means from {means_path}: {e}")
+        return None
+
+    def _fill_missing(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Impute NaNs from precomputed training means when available.
+
+        Persisted means are both statistically correct (batch means drift
+        from training stats) and cheaper: they skip the O(rows x cols)
+        mean reduction every predict call otherwise pays.
+        """
+        if self._feature_means is not None:
+            return X.fillna(self._feature_means)
+        return X.fillna(X.mean())
+
     def predict_porosity(self, df: pd.DataFrame) -> np.ndarray:
         """Predict porosity values (PHI_COMBINED)."""
         X = self._safe_select(df, FEATURES_POROSITY, "porosity")
         if X.empty:
             raise ValueError("No valid features available for porosity prediction")
-        X = X.fillna(X.mean())
-        return self.porosity_model.predict(X)
+        X = self._fill_missing(X)
+        return _fast_predict(self.porosity_model, X)
 
     def predict_fluid(self, df: pd.DataFrame) -> tuple:
         """Predict fluid type and class probabilities."""
         X = self._safe_select(df, FEATURES_FLUID, "fluid")
         if X.empty:
             raise ValueError("No valid features available for fluid prediction")
-        X = X.fillna(X.mean())
+        X = self._fill_missing(X)
         pred_class = self.fluid_model.predict(X)
         pred_proba = self.fluid_model.predict_proba(X)
         return self.fluid_encoder.inverse_transform(pred_class), pred_proba
 
     def predict_pressure(self, df: pd.DataFrame) -> np.ndarray | None:
-        """Predict pore pressure using the full FEATURES_PRESSURE list."""
+        """Predict pore pressure using the booster's training feature list."""
         try:
-            X = self._safe_select(df, FEATURES_PRESSURE, "pressure", force_full=True)
+            # One reindex against the cached booster feature list replaces
+            # the old select + per-call feature_names lookup + add-missing
+            # loop; absent columns come back as NaN and fall into the fill.
+            X = df.reindex(columns=self._pressure_features).astype(
+                np.float32, copy=False
+            )
             if X.empty:
                 raise ValueError("No valid features available for pressure prediction")
 
-            X = X.fillna(X.mean()).fillna(0)
+            X = self._fill_missing(X).fillna(0)
+            return _fast_predict(self.pressure_model, X)
+        except Exception as e:
+            logger.warning(f"Pressure prediction unavailable: {e}")
+            return None
+
+    def predict_all(self, df: pd.DataFrame) -> dict:
+        """Run all three model predictions from one shared feature frame.
 
-            expected_features = self.pressure_model.get_booster().feature_names
+        The three feature sets overlap heavily (DEPTH, ROP, WOB, torque...),
+        so the union is selected and NaN-filled once and each model slices
+        its columns from the shared frame, instead of three independent
+        _safe_select + fillna passes over the same data.
 
-            missing_for_model = [f for f in expected_features if f not in X.columns]
-            if missing_for_model:
-                logger.warning(
-                    f"Pressure model expected extra features; adding missing: {missing_for_model}"
+        Returns:
+            dict with keys 'porosity', 'fluid', 'fluid_proba', 'pressure';
+            an entry is None when that model's prediction failed.
+        """
+        shared = df.reindex(columns=FEATURES_UNION).astype(np.float32)
+        shared = self._fill_missing(shared)
+
+        # The reindex manufactures all-NaN columns for features the
+        # caller never supplied, and XGBoost treats NaN (or an imputed
+        # mean) as a valid input — a frame missing a model's features
+        # would come back with fabricated constant predictions instead
+        # of failing. Gate each model on the caller's actual schema, the
+        # same availability check _safe_select applies on the per-model
+        # paths.
+        caller_cols = set(df.columns)
+
+        def _require(features: tuple, model_name: str) -> None:
+            missing = [f for f in features if f not in caller_cols]
+            if missing:
+                raise ValueError(
+                    f"Missing required features for {model_name}: {missing}"
                 )
-                for f in missing_for_model:
-                    X[f] = 0
 
-            X = X[expected_features]
-            return self.pressure_model.predict(X)
-        except Exception as e:
-            logger.warning(f"Pressure prediction unavailable: {e}")
-            return None
+        results = {"porosity": None, "fluid": None, "fluid_proba": None, "pressure": None}
+
+        def _run_porosity():
+            try:
+                _require(FEATURES_POROSITY, "porosity")
+                results["porosity"] = _fast_predict(
+                    self.porosity_model, shared.iloc[:, _POROSITY_IDX]
+                )
+            except Exception as e:
+                logger.warning(f"Porosity prediction unavailable: {e}")
+
+        def _run_fluid():
+            try:
+                _require(FEATURES_FLUID, "fluid")
+                X = shared.iloc[:, _FLUID_IDX]
+                pred_class = self.fluid_model.predict(X)
+                results["fluid_proba"] = self.fluid_model.predict_proba(X)
+                results["fluid"] = self.fluid_encoder.inverse_transform(pred_class)
+            except Exception as e:
+                logger.warning(f"Fluid prediction unavailable: {e}")
+
+        def _run_pressure():
+            try:
+                _require(FEATURES_PRESSURE, "pressure")
+                X = (
+                    shared.iloc[:, _PRESSURE_IDX]
+                    .fillna(0)
+                    .reindex(columns=self._pressure_features, fill_value=0)
+                )
+                results["pressure"] = _fast_predict(self.pressure_model, X)
+            except Exception as e:
+                logger.warning(f"Pressure prediction unavailable: {e}")
+
+        # The three tree traversals are independent and XGBoost's C++
+        # predict core releases the GIL, so they overlap on real cores.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            for fn in (_run_porosity, _run_fluid, _run_pressure):
+                pool.submit(fn)
+
+        return results
 
     def _safe_select(
         self,
         df: pd.DataFrame,
-        features: list,
+        features: tuple,
         model_name: str,
         force_full: bool = False,
     ) -> pd.DataFrame:
-        """Select features with fallback and error handling."""
+        """Select features with fallback and error handling.
+
+        Selected frames are downcast to float32: XGBoost converts to
+        float32 internally anyway, so casting here halves the bandwidth
+        of every downstream fillna/predict/SHAP pass with no quality
+        loss, instead of paying the conversion inside each predict call.
+        """
         if force_full:
-            selected = df.reindex(columns=features).copy()
+            selected = df.reindex(columns=features).astype(np.float32, copy=False)
             return selected
 
-        available = [f for f in features if f in df.columns]
+        # Feature availability only depends on the frame's schema, so the
+        # membership scan is memoized per (model, columns) — repeated
+        # predictions over slices of the same dataset skip it entirely.
+        cache_key = (model_name, tuple(df.columns))
+        available = self._col_cache.get(cache_key)
 
-        if len(available) < 3:
-            logger.warning(
-                f"Not enough features for {model_name} model. Using minimal set."
-            )
-            available = [f for f in MINIMAL_FEATURES if f in df.columns]
+        if available is None:
+            available = [f for f in features if f in df.columns]
+
+            if len(available) < 3:
+                logger.warning(
+                    f"Not enough features for {model_name} model. Using minimal set."
+                )
+                available = [f for f in MINIMAL_FEATURES if f in df.columns]
+
+            self._col_cache[cache_key] = available
 
         if len(available) == 0:
             logger.error(f"No valid features found for {model_name} prediction.")
             raise ValueError(f"Cannot proceed: no valid features for {model_name}")
 
-        selected = df[available].copy()
+        selected = df[available].astype(np.float32, copy=False)
 
         if selected.isna().all().any():
             problematic = selected.columns[selected.isna().all()].tolist()
@@ -164,3 +315,20 @@ class ModelManager:
             )
 
         return selected
+
+
+# Process-wide singleton: the app startup thread and the predict/shap
+# routes all need a manager, and each construction unpickles four model
+# artifacts from disk. Share one instance instead.
+_instance: "ModelManager | None" = None
+_instance_lock = threading.Lock()
+
+
+def get_model_manager() -> ModelManager:
+    """Return the shared ModelManager, loading the models on first call."""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = ModelManager()
+    return _instance
@@ -18,52 +18,109 @@ import json
 from datetime import datetime
 import logging
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is an optional accelerator
+    pa = None
+    pa_csv = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _confidence_core(model, X_test, y_pred: np.ndarray, dmatrix=None):
+    """Variance-of-truncated-ensembles confidence; None when unavailable.
+
+    Returns None (rather than a filled fallback array) whenever the
+    model isn't an XGBoost estimator or fewer than two checkpoint
+    predictions succeed, so the wrapper can hand out one shared
+    read-only fallback instead of allocating per call.
+    """
+    if not (hasattr(model, "predict") and hasattr(model, "get_booster")):
+        return None
+
+    booster = model.get_booster()
+    n_trees = getattr(booster, "best_ntree_limit", None)
+    if n_trees is None:
+        n_trees = booster.num_boosted_rounds()
+
+    if dmatrix is None:
+        try:
+            import xgboost as xgb  # noqa: PLC0415
+
+            values = X_test.to_numpy() if hasattr(X_test, "to_numpy") else X_test
+            values = np.ascontiguousarray(values, dtype=np.float32)
+            # Bare arrays carry no column labels, so reattach the
+            # booster's training names for its validation check.
+            if hasattr(X_test, "columns"):
+                feature_names = X_test.columns.tolist()
+            else:
+                feature_names = booster.feature_names
+            dmatrix = xgb.DMatrix(values, feature_names=feature_names)
+        except Exception:
+            dmatrix = None
+
+    checkpoints = [
+        max(1, n_trees // 4),
+        max(1, n_trees // 2),
+        max(1, 3 * n_trees // 4),
+        n_trees,
+    ]
+    # Preallocated checkpoint matrix: each staged predict writes
+    # its row directly, so no list-of-arrays vstack copy at the end.
+    predictions_all = np.empty((len(checkpoints), len(X_test)))
+    filled = 0
+    for ntrees in checkpoints:
+        try:
+            if dmatrix is not None:
+                pred = booster.predict(dmatrix, iteration_range=(0, ntrees))
+            else:
+                pred = model.predict(X_test, iteration_range=(0, ntrees))
+            predictions_all[filled] = pred
+            filled += 1
+        except Exception:
+            break
+
+    if filled < 2:
+        return None
+
+    predictions_all = predictions_all[:filled]
+    variance = np.var(predictions_all, axis=0)
+    mean_pred = np.mean(predictions_all, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cv = np.sqrt(variance) / (np.abs(mean_pred) + 1e-6)
+        confidence = 1.0 / (1.0 + cv)
+        return np.clip(confidence, 0, 1)
+
+
 def compute_prediction_confidence(
-    model, X_test: pd.DataFrame, y_pred: np.ndarray
+    model, X_test, y_pred: np.ndarray, dmatrix=None
 ) -> np.ndarray:
     """Estimate prediction confidence from XGBoost model internals.
 
     Uses prediction variance across different tree iteration depths.
-    Returns confidence scores (0-1 scale).
+    ``X_test`` may be a DataFrame or an ndarray; it is packed into one
+    C-contiguous float32 DMatrix (built here, or passed in via
+    ``dmatrix`` by callers that already have one) shared by the four
+    truncated-ensemble predictions, rather than letting the sklearn
+    wrapper rebuild a float64 DMatrix per call.
+    Returns confidence scores (0-1 scale); when confidence cannot be
+    estimated, a read-only all-ones broadcast view (no N-element
+    allocation) is returned.
     """
     try:
-        if hasattr(model, "predict") and hasattr(model, "get_booster"):
-            booster = model.get_booster()
-            n_trees = getattr(booster, "best_ntree_limit", None)
-            if n_trees is None:
-                n_trees = booster.num_boosted_rounds()
-
-            predictions_all = []
-            for ntrees in [
-                max(1, n_trees // 4),
-                max(1, n_trees // 2),
-                max(1, 3 * n_trees // 4),
-                n_trees,
-            ]:
-                try:
-                    pred = model.predict(X_test, iteration_range=(0, ntrees))
-                    predictions_all.append(pred)
-                except Exception:
-                    break
-
-            if len(predictions_all) > 1:
-                predictions_all = np.vstack(predictions_all)
-                variance = np.var(predictions_all, axis=0)
-                mean_pred = np.mean(predictions_all, axis=0)
-
-                with np.errstate(divide="ignore", invalid="ignore"):
-                    cv = np.sqrt(variance) / (np.abs(mean_pred) + 1e-6)
-                    confidence = 1.0 / (1.0 + cv)
-                    confidence = np.clip(confidence, 0, 1)
-                    return confidence
-
-        return np.ones(len(y_pred))
-
+        confidence = _confidence_core(model, X_test, y_pred, dmatrix)
     except Exception:
-        return np.ones(len(y_pred))
+        confidence = None
+    if confidence is None:
+        return np.broadcast_to(1.0, np.shape(y_pred))
+    return confidence
 
 
 def compute_prediction_intervals(
@@ -71,23 +128,50 @@ def compute_prediction_intervals(
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Estimate prediction intervals based on confidence scores."""
     z_score = 1.96 if ci == 0.95 else 1.645 if ci == 0.90 else 1.0
-    margin = z_score * (1 - confidence) * np.abs(y_pred + 1e-6)
+    # In-place ufunc chain: the scale and margin buffers are each
+    # allocated once and rewritten, instead of the one-temporary-per-
+    # operator chain z*(1-c)*abs(y+eps) (four throwaway arrays).
+    scale = 1.0 - confidence
+    scale *= z_score
+    margin = y_pred + 1e-6
+    np.abs(margin, out=margin)
+    margin *= scale
     lower = y_pred - margin
     upper = y_pred + margin
     return lower, upper
 
 
-def export_predictions_csv(df: pd.DataFrame, predictions: dict) -> str:
-    """Export predictions with confidence to CSV string (in-memory)."""
-    export_df = (
-        df[["DEPTH"]].copy()
+def export_predictions_csv(df: pd.DataFrame, predictions: dict, buf=None) -> Optional[str]:
+    """Export predictions with confidence to CSV (in-memory).
+
+    When ``buf`` (any writable text buffer) is given, the CSV is written
+    straight into it and None is returned, skipping the intermediate
+    string that ``to_csv(None)`` would otherwise materialize — callers
+    streaming a response can hand the buffer on directly. Without a
+    buffer, the CSV string is returned as before.
+    """
+    columns = (
+        {"DEPTH": df["DEPTH"].to_numpy()}
         if "DEPTH" in df.columns
-        else pd.DataFrame({"Row": range(len(df))})
+        else {"Row": np.arange(len(df))}
     )
     for key, values in predictions.items():
         if isinstance(values, np.ndarray):
-            export_df[key] = values
-    return export_df.to_csv(index=False)
+            columns[key] = values
+
+    if pa is not None:
+        # Typed C writer: skips pandas' per-value Python formatter and
+        # releases the GIL while serializing.
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(pa.table(columns), sink)
+        text = sink.getvalue().to_pybytes().decode("utf-8")
+        if buf is not None:
+            buf.write(text)
+            return None
+        return text
+
+    export_df = pd.DataFrame(columns)
+    return export_df.to_csv(buf, index=False)
 
 
 def export_predictions_json(
@@ -103,6 +187,19 @@ def export_predictions_json(
         },
         "predictions": {},
     }
+
+    if orjson is not None:
+        # orjson encodes ndarrays natively, so no N-element Python list
+        # (one PyFloat per value) is materialized per column.
+        if "DEPTH" in df.columns:
+            export_data["predictions"]["DEPTH"] = df["DEPTH"].to_numpy()
+        for key, values in predictions.items():
+            if isinstance(values, np.ndarray):
+                export_data["predictions"][key] = values
+        return orjson.dumps(
+            export_data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        ).decode("utf-8")
+
     if "DEPTH" in df.columns:
         export_data["predictions"]["DEPTH"] = df["DEPTH"].tolist()
     for key, values in predictions.items():
@@ -114,40 +211,45 @@ def export_predictions_json(
 def create_prediction_report(
     df: pd.DataFrame, predictions: dict, confidences: dict = None
 ) -> pd.DataFrame:
-    """Create a comprehensive prediction report DataFrame."""
-    report = (
-        df[["DEPTH"]].copy()
-        if "DEPTH" in df.columns
-        else pd.DataFrame(index=range(len(df)))
-    )
+    """Create a comprehensive prediction report DataFrame.
+
+    Columns are collected into a dict and the frame is constructed once
+    at the end; assigning ~10 columns onto a live DataFrame fragments
+    its BlockManager (one block per insert, pandas'
+    "highly fragmented" PerformanceWarning) and re-copies on
+    consolidation.
+    """
+    cols = {}
+    if "DEPTH" in df.columns:
+        cols["DEPTH"] = df["DEPTH"].to_numpy()
 
     if "PHI_COMBINED" in df.columns:
-        report["Porosity (True)"] = df["PHI_COMBINED"]
+        cols["Porosity (True)"] = df["PHI_COMBINED"].to_numpy()
     if "phi_pred" in predictions:
-        report["Porosity (Predicted)"] = predictions["phi_pred"]
+        cols["Porosity (Predicted)"] = predictions["phi_pred"]
         if confidences and "phi_conf" in confidences:
-            report["Porosity Confidence"] = confidences["phi_conf"]
+            cols["Porosity Confidence"] = confidences["phi_conf"]
             lower, upper = compute_prediction_intervals(
                 predictions["phi_pred"], confidences["phi_conf"]
             )
-            report["Porosity Lower Bound"] = lower
-            report["Porosity Upper Bound"] = upper
+            cols["Porosity Lower Bound"] = lower
+            cols["Porosity Upper Bound"] = upper
 
     if "FLUID_CLASS" in df.columns:
-        report["Fluid Type (True)"] = df["FLUID_CLASS"]
+        cols["Fluid Type (True)"] = df["FLUID_CLASS"].to_numpy()
     if "fluid_pred" in predictions:
-        report["Fluid Type (Predicted)"] = predictions["fluid_pred"]
+        cols["Fluid Type (Predicted)"] = predictions["fluid_pred"]
 
     if "PREDICTED_PORE_PRESSURE_PSI" in df.columns:
-        report["Pore Pressure (True, PSI)"] = df["PREDICTED_PORE_PRESSURE_PSI"]
+        cols["Pore Pressure (True, PSI)"] = df["PREDICTED_PORE_PRESSURE_PSI"].to_numpy()
     if "pp_pred" in predictions:
-        report["Pore Pressure (Predicted, PSI)"] = predictions["pp_pred"]
+        cols["Pore Pressure (Predicted, PSI)"] = predictions["pp_pred"]
         if confidences and "pp_conf" in confidences:
-            report["Pressure Confidence"] = confidences["pp_conf"]
+            cols["Pressure Confidence"] = confidences["pp_conf"]
             lower, upper = compute_prediction_intervals(
                 predictions["pp_pred"], confidences["pp_conf"]
             )
-            report["Pressure Lower Bound (PSI)"] = lower
-            report["Pressure Upper Bound (PSI)"] = upper
+            cols["Pressure Lower Bound (PSI)"] = lower
+            cols["Pressure Upper Bound (PSI)"] = upper
 
-    return report
+    return pd.DataFrame(cols, index=df.index, copy=False)
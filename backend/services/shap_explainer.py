@@ -12,9 +12,91 @@ if not hasattr(np, "float"):
 import pandas as pd
 
 
+# Cap on rows actually explained per call; SHAP cost scales linearly with
+# the explained set, and summary plots saturate well below this.
+DEFAULT_SAMPLE_SIZE = 500
+
+# Background rows used for feature expectations in the model-agnostic
+# fallback explainer. Expectations converge with ~50-100 representative
+# rows; larger backgrounds only multiply evaluation cost.
+BACKGROUND_SIZE = 100
+
+# Tree explainers are sample-independent, so one instance per model can be
+# reused across calls. Keyed by id(model); ModelManager keeps its models
+# alive for the process lifetime so ids stay stable.
+_explainer_cache = {}
+
+
+def _booster_shap_values(model, X_sample):
+    """SHAP values straight from the booster via ``pred_contribs=True``.
+
+    For XGBoost models this is the same tree-path algorithm TreeExplainer
+    runs, but in one C call without SHAP's Python marshalling or the
+    intermediate Explanation object. Returns an (n_samples, n_features)
+    array (multi-class contributions are aggregated by mean |SHAP| across
+    classes, matching the fallback path), or None when the model isn't an
+    XGBoost estimator or the native call fails.
+    """
+    if not isinstance(model, xgb.XGBModel):
+        return None
+    try:
+        feature_names = (
+            X_sample.columns.tolist() if hasattr(X_sample, "columns") else None
+        )
+        dmat = xgb.DMatrix(X_sample, feature_names=feature_names)
+        contribs = model.get_booster().predict(dmat, pred_contribs=True)
+    except Exception:
+        return None
+    # Last column is the bias term.
+    contribs = contribs[..., :-1]
+    if contribs.ndim == 3:
+        # (n_samples, n_classes, n_features) for multi-class boosters.
+        contribs = np.mean(np.abs(contribs), axis=1)
+    return contribs
+
+
+def _subsample(X, n, random_state=42):
+    """Return at most n rows of X (DataFrame or ndarray), deterministically."""
+    if len(X) <= n:
+        return X
+    if hasattr(X, "sample"):
+        return X.sample(n, random_state=random_state)
+    rng = np.random.RandomState(random_state)
+    return X[rng.choice(len(X), n, replace=False)]
+
+
 def _create_shap_explainer(model, X_sample):
-    """Create SHAP explainer with XGBoost 2.0+ compatibility."""
+    """Create SHAP explainer with XGBoost 2.0+ compatibility.
+
+    For tree models, prefers the dedicated tree-path explainers: GPUTree
+    (GPUTreeShap kernels, ~10x+ over CPU tree SHAP) when a CUDA device is
+    usable, then TreeExplainer. Falls back to the model-agnostic
+    Explainer over a wrapped predict for anything else.
+    """
     if isinstance(model, xgb.XGBModel):
+        cached = _explainer_cache.get(id(model))
+        if cached is not None:
+            return cached
+
+        # GPUTree silently constructs without a CUDA build, so probe the
+        # CUDA extension explicitly before committing to the GPU path.
+        try:
+            from shap.utils import assert_import
+
+            assert_import("cext_gpu")
+            explainer = shap.explainers.GPUTree(model)
+            _explainer_cache[id(model)] = explainer
+            return explainer
+        except Exception:
+            pass
+
+        try:
+            explainer = shap.TreeExplainer(model)
+            _explainer_cache[id(model)] = explainer
+            return explainer
+        except Exception:
+            pass
+
         # Get the number of boosting rounds
         try:
             n_trees = model.num_boosted_rounds()
@@ -31,11 +113,12 @@ def _create_shap_explainer(model, X_sample):
             def safe_predict(data):
                 return model.predict(data)
 
-        # Use Explainer with wrapped predict function
-        explainer = shap.Explainer(safe_predict, X_sample)
+        # Use Explainer with wrapped predict function over a subsampled
+        # background set (feature expectations, not the explained rows)
+        explainer = shap.Explainer(safe_predict, _subsample(X_sample, BACKGROUND_SIZE))
         return explainer
     else:
-        return shap.Explainer(model.predict, X_sample)
+        return shap.Explainer(model.predict, _subsample(X_sample, BACKGROUND_SIZE))
 
 
 def explain_model(model, X_sample, feature_names, title="SHAP Summary"):
@@ -62,6 +145,9 @@ def explain_model(model, X_sample, feature_names, title="SHAP Summary"):
                 else [f"Feature_{i}" for i in range(X_sample.shape[1])]
             )
 
+        # Cap the explained set; the beeswarm saturates long before this
+        X_sample = _subsample(X_sample, DEFAULT_SAMPLE_SIZE)
+
         # Check model type to select appropriate explainer
         explainer = _create_shap_explainer(model, X_sample)
 
@@ -151,11 +237,17 @@ def get_shap_interpretation(
         if display_names is None:
             display_names = {name: name for name in feature_names}
 
-        # Calculate SHAP values using new helper function
-        explainer = _create_shap_explainer(model, X_sample)
+        # Cap the explained set before computing SHAP values
+        X_sample = _subsample(X_sample, DEFAULT_SAMPLE_SIZE)
 
-        # Get SHAP values - use new API for Explainer
-        shap_values = explainer(X_sample)
+        # Fast path: pull tree-path SHAP values straight from the booster
+        # in one C call; fall back to the SHAP explainers otherwise.
+        shap_values = _booster_shap_values(model, X_sample)
+        if shap_values is None:
+            explainer = _create_shap_explainer(model, X_sample)
+
+            # Get SHAP values - use new API for Explainer
+            shap_values = explainer(X_sample)
 
         # Handle multi-class case: aggregate across classes
         if isinstance(shap_values, list):
@@ -179,53 +271,53 @@ def get_shap_interpretation(
             raise ValueError(f"SHAP values have unexpected shape: {shap_values.shape}")
 
         # Calculate mean absolute SHAP values (global feature importance)
+        # and signed column means in two vectorized reductions, instead of
+        # one np.mean dispatch per feature inside a list comprehension.
         mean_abs_shap = np.abs(shap_values).mean(axis=0)
+        is_up = shap_values.mean(axis=0) > 0
 
-        # Create ranking DataFrame with both original and display names
+        # Assemble the ranking pre-sorted by importance via argsort.
+        order = np.argsort(-mean_abs_shap, kind="stable")
+        feature_names = np.asarray(feature_names)[order]
+        is_up = is_up[order]
         importance_df = pd.DataFrame(
             {
                 "Original Name": feature_names,
                 "Display Name": [display_names.get(f, f) for f in feature_names],
-                "Mean |SHAP|": mean_abs_shap,
-                "Direction": [
-                    "↑ PUSH UP" if np.mean(shap_values[:, i]) > 0 else "↓ PUSH DOWN"
-                    for i in range(len(feature_names))
-                ],
+                "Mean |SHAP|": mean_abs_shap[order],
+                "Direction": np.where(is_up, "↑ PUSH UP", "↓ PUSH DOWN"),
             }
-        ).sort_values("Mean |SHAP|", ascending=False)
-
-        # Get top positive and negative contributors
-        top_positive = importance_df[importance_df["Direction"] == "↑ PUSH UP"].head(
-            top_n
-        )
-        top_negative = importance_df[importance_df["Direction"] == "↓ PUSH DOWN"].head(
-            top_n
         )
 
-        # Build interpretation text using display names
-        summary = "### 🔍 SHAP Model Interpretation Summary\n\n"
-        summary += f"**Analysis of {len(X_sample)} samples**\n\n"
-
-        summary += "#### ⬆️ Top Features Increasing Predictions (Positive Impact):\n"
-        if not top_positive.empty:
-            for idx, row in top_positive.iterrows():
-                summary += f"- **{row['Display Name']}**: {row['Mean |SHAP|']:.4f} (avg contribution)\n"
-        else:
-            summary += "- No strongly positive features detected\n"
-
-        summary += "\n#### ⬇️ Top Features Decreasing Predictions (Negative Impact):\n"
-        if not top_negative.empty:
-            for idx, row in top_negative.iterrows():
-                summary += f"- **{row['Display Name']}**: {row['Mean |SHAP|']:.4f} (avg contribution)\n"
-        else:
-            summary += "- No strongly negative features detected\n"
-
-        summary += f"\n#### 📊 Overall Insight:\n"
-        summary += (
-            f"The model's predictions are primarily driven by {top_n} key features. "
-        )
-        summary += f"The **{importance_df.iloc[0]['Display Name']}** has the strongest influence with "
-        summary += f"an average |SHAP| value of **{importance_df.iloc[0]['Mean |SHAP|']:.4f}**.\n"
+        # Top contributors come straight off the boolean mask — no
+        # object-dtype string comparison over the Direction column.
+        top_positive = importance_df[is_up].head(top_n)
+        top_negative = importance_df[~is_up].head(top_n)
+
+        # Build interpretation text using display names. Lines accumulate
+        # in a list joined once at the end — iterrows boxes every cell
+        # into a per-row Series and += re-copies the growing string.
+        def _driver_lines(block, empty_note):
+            if block.empty:
+                return [empty_note]
+            return [
+                f"- **{name}**: {val:.4f} (avg contribution)\n"
+                for name, val in zip(block["Display Name"], block["Mean |SHAP|"])
+            ]
+
+        parts = [
+            "### 🔍 SHAP Model Interpretation Summary\n\n",
+            f"**Analysis of {len(X_sample)} samples**\n\n",
+            "#### ⬆️ Top Features Increasing Predictions (Positive Impact):\n",
+            *_driver_lines(top_positive, "- No strongly positive features detected\n"),
+            "\n#### ⬇️ Top Features Decreasing Predictions (Negative Impact):\n",
+            *_driver_lines(top_negative, "- No strongly negative features detected\n"),
+            "\n#### 📊 Overall Insight:\n",
+            f"The model's predictions are primarily driven by {top_n} key features. ",
+            f"The **{importance_df.iloc[0]['Display Name']}** has the strongest influence with ",
+            f"an average |SHAP| value of **{importance_df.iloc[0]['Mean |SHAP|']:.4f}**.\n",
+        ]
+        summary = "".join(parts)
 
         return {
             "summary": summary,
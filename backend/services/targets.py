@@ -12,6 +12,77 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    numba = None
+
+# Unit-conversion constants folded at import time: 1 Pa = 1.450e-4 psi,
+# and g * pa_to_psi so hydrostatic psi is a single scalar multiply.
+_PA_TO_PSI = 0.00014503773773020923
+_G_PA_TO_PSI = 9.80665 * _PA_TO_PSI
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _phi_kernel(rho_bulk, rho_matrix, rho_fluid):
+        """JIT-compiled Wyllie porosity kernel: clip((m - rho)/(m - f), 0, 1).
+
+        cache=True persists the compiled code to __pycache__ so the
+        compile cost is paid once per machine, not per process.
+        """
+        out = np.empty(rho_bulk.shape[0])
+        denom = rho_matrix - rho_fluid
+        for i in range(rho_bulk.shape[0]):
+            phi = (rho_matrix - rho_bulk[i]) / denom
+            if not np.isfinite(phi):
+                out[i] = np.nan
+            elif phi < 0.0:
+                out[i] = 0.0
+            elif phi > 1.0:
+                out[i] = 1.0
+            else:
+                out[i] = phi
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def _pp_kernel(rho, depth, dc):
+        """Fused pore-pressure kernel: hydrostatic + exponent anomaly, clipped.
+
+        One pass over the three inputs replaces the chain of fillna,
+        multiply, add, isfinite, and clip array temporaries; rows run in
+        parallel via prange. fastmath is deliberately off so NaN
+        propagation matches the NumPy path.
+        """
+        g_psi = _G_PA_TO_PSI
+        nominal = 1.0
+        scale = 1000.0 / 0.1
+        n = rho.shape[0]
+        out = np.empty(n)
+        for i in numba.prange(n):
+            r = rho[i]
+            if np.isnan(r):
+                r = 1000.0  # fallback to water density
+            d = depth[i]
+            if np.isnan(d):
+                d = 0.0
+            e = dc[i]
+            if np.isnan(e):
+                e = nominal  # missing exponent contributes no anomaly
+            val = r * d * g_psi + (nominal - e) * scale
+            if not np.isfinite(val):
+                out[i] = np.nan
+            elif val < 0.0:
+                out[i] = 0.0
+            else:
+                out[i] = val
+        return out
+
+else:
+    _phi_kernel = None
+    _pp_kernel = None
+
 
 def _phi_from_density(rho_bulk, rho_matrix=2650.0, rho_fluid=1000.0):
     """Compute porosity from bulk density using Wyllie-style approximation.
@@ -21,11 +92,33 @@ def _phi_from_density(rho_bulk, rho_matrix=2650.0, rho_fluid=1000.0):
     rho_fluid: fluid density (default water ~1000 kg/m3)
     Returns porosity as fraction (0-1). Values clipped to [0, 1].
     """
-    with np.errstate(divide='ignore', invalid='ignore'):
-        phi = (rho_matrix - rho_bulk) / (rho_matrix - rho_fluid)
-    phi = np.asarray(phi, dtype=float)
-    phi = np.where(np.isfinite(phi), phi, np.nan)
-    return np.clip(phi, 0.0, 1.0)
+    arr = np.asarray(rho_bulk, dtype=float)
+    if _phi_kernel is not None:
+        try:
+            return _phi_kernel(arr.ravel(), rho_matrix, rho_fluid).reshape(arr.shape)
+        except Exception:
+            # numba's cache=True store is keyed by the module's import
+            # name, and this module loads both as services.targets and
+            # backend.services.targets; a cache written under one name
+            # fails under the other. Degrade to the NumPy path below.
+            pass
+
+    denom = rho_matrix - rho_fluid
+    if denom == 0:
+        return np.full(arr.shape, np.nan)
+
+    # In-place clamp: maximum/minimum with out= avoid the temporaries of
+    # np.clip and both propagate NaN. A +/-inf bulk density still yields
+    # an infinite ratio, though, which the clamp would silently pin to
+    # 0/1 — rewrite those to NaN first, matching the kernel's
+    # isfinite check.
+    phi = np.asarray((rho_matrix - arr) / denom)
+    nonfinite = ~np.isfinite(phi)
+    if nonfinite.any():
+        phi[nonfinite] = np.nan
+    np.maximum(phi, 0.0, out=phi)
+    np.minimum(phi, 1.0, out=phi)
+    return phi
 
 
 def compute_phi_combined(df: pd.DataFrame, out_col: str = 'PHI_COMBINED') -> pd.Series:
@@ -48,20 +141,35 @@ def compute_phi_combined(df: pd.DataFrame, out_col: str = 'PHI_COMBINED') -> pd.
 
     if neutron_col in df.columns:
         # Assume neutron log is already a fractional porosity or percent
-        neutron = df[neutron_col].values
-        # If values look like percent (>1), convert to fraction
-        neutron = np.where(np.nan_to_num(neutron) > 1.5, neutron / 100.0, neutron)
+        neutron = df[neutron_col].to_numpy(dtype=np.float64, copy=True)
+        # If values look like percent (>1), convert to fraction. NaN > 1.5
+        # compares False, so no nan_to_num copy is needed for the mask,
+        # and the masked multiply rewrites the one owned buffer in place
+        # instead of np.where materializing neutron/100 and the blend.
+        with np.errstate(invalid="ignore"):
+            mask = neutron > 1.5
+        np.multiply(neutron, 0.01, where=mask, out=neutron)
         phi_estimates.append(neutron)
 
     if not phi_estimates:
         # Nothing to compute
-        return pd.Series([np.nan] * n, index=df.index, name=out_col)
+        return pd.Series(np.full(n, np.nan), index=df.index, name=out_col)
 
-    stacked = np.vstack([np.asarray(a, dtype=float) for a in phi_estimates])
-    # mean across available estimates, ignoring NaN
-    phi_comb = np.nanmean(stacked, axis=0)
-    phi_comb = np.clip(phi_comb, 0.0, 1.0)
+    # There are at most two estimates, so the NaN-ignoring mean is done
+    # with direct ufuncs instead of stacking into a (k, n) temporary and
+    # paying np.nanmean's internal mask-and-copy.
+    if len(phi_estimates) == 1:
+        phi_comb = np.asarray(phi_estimates[0], dtype=float)
+    else:
+        a = np.asarray(phi_estimates[0], dtype=float)
+        b = np.asarray(phi_estimates[1], dtype=float)
+        mask_a = ~np.isnan(a)
+        mask_b = ~np.isnan(b)
+        count = mask_a.astype(np.int8) + mask_b.astype(np.int8)
+        total = np.where(mask_a, a, 0.0) + np.where(mask_b, b, 0.0)
+        phi_comb = np.where(count > 0, total / np.maximum(count, 1), np.nan)
 
+    phi_comb = np.clip(phi_comb, 0.0, 1.0)
     return pd.Series(phi_comb, index=df.index, name=out_col)
 
 
@@ -78,24 +186,40 @@ def compute_fluid_class(df: pd.DataFrame, phi_col: str = 'PHI_COMBINED', out_col
     gas_col = 'Chrom 1 Total Gas Euc'
 
     n = len(df)
-    result = pd.Series(['Background'] * n, index=df.index, name=out_col)
+    categories = ['Background', 'Pay Zone', 'Potential Reservoir']
 
     if resist_col not in df.columns and gas_col not in df.columns:
-        return result
-
-    resist = df[resist_col] if resist_col in df.columns else pd.Series([np.nan] * n, index=df.index)
-    gas = df[gas_col] if gas_col in df.columns else pd.Series([np.nan] * n, index=df.index)
-    phi = df[phi_col] if phi_col in df.columns else pd.Series([np.nan] * n, index=df.index)
-
-    # Potential Reservoir
-    cond_pot = (resist.fillna(0) >= 100) | ((gas.fillna(0) >= 50) & (phi.fillna(0) >= 0.05))
-    result.loc[cond_pot] = 'Potential Reservoir'
-
-    # Pay Zone (exclude those already marked potential)
-    cond_pay = ((resist.fillna(0) >= 20) | (gas.fillna(0) >= 10)) & (~cond_pot)
-    result.loc[cond_pay] = 'Pay Zone'
-
-    return result
+        return pd.Series(
+            pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories),
+            index=df.index,
+            name=out_col,
+        )
+
+    def _col_values(col):
+        if col in df.columns:
+            # to_numpy(copy=True) yields the one owned buffer per column;
+            # nan_to_num then zeroes NaNs in place on it rather than
+            # allocating a second full-length array.
+            arr = df[col].to_numpy(dtype=np.float64, copy=True)
+            return np.nan_to_num(arr, copy=False)
+        return np.zeros(n)
+
+    resist = _col_values(resist_col)
+    gas = _col_values(gas_col)
+    phi = _col_values(phi_col)
+
+    # Potential Reservoir, then Pay Zone (excluding potential), else Background.
+    # Classes are carried as int8 codes in a Categorical: one byte per row
+    # instead of an object-dtype Series of Python strings.
+    cond_pot = (resist >= 100) | ((gas >= 50) & (phi >= 0.05))
+    cond_pay = ((resist >= 20) | (gas >= 10)) & ~cond_pot
+
+    codes = np.zeros(n, dtype=np.int8)
+    codes[cond_pay] = 1
+    codes[cond_pot] = 2
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories), index=df.index, name=out_col
+    )
 
 
 def compute_pore_pressure(df: pd.DataFrame, out_col: str = 'PREDICTED_PORE_PRESSURE_PSI') -> pd.Series:
@@ -113,20 +237,44 @@ def compute_pore_pressure(df: pd.DataFrame, out_col: str = 'PREDICTED_PORE_PRESS
     dc_col = 'Corrected Drilling Exponent unitless'
 
     n = len(df)
-    psi_result = pd.Series([np.nan] * n, index=df.index, name=out_col)
+
+    # Fused JIT path: one parallel pass over the raw columns, with the
+    # NaN fallbacks applied per element inside the kernel instead of via
+    # fillna/where temporaries.
+    if (
+        _pp_kernel is not None
+        and mud_col in df.columns
+        and depth_col in df.columns
+    ):
+        rho = df[mud_col].to_numpy(dtype=float)
+        depth = df[depth_col].to_numpy(dtype=float)
+        if dc_col in df.columns:
+            dc = df[dc_col].to_numpy(dtype=float)
+        else:
+            dc = np.full(n, 1.0)
+        try:
+            psi = _pp_kernel(rho, depth, dc)
+            return pd.Series(psi, index=df.index, name=out_col)
+        except Exception:
+            # Same dual-import-name numba cache hazard as _phi_kernel:
+            # fall through to the NumPy path rather than propagate.
+            pass
 
     # Compute hydrostatic psi
     if mud_col in df.columns and depth_col in df.columns:
-        rho = df[mud_col].fillna(1000.0).values  # fallback to water
+        # fallback to water density; copy=True guarantees a writable
+        # buffer (under copy-on-write, .values after fillna can come
+        # back read-only).
+        rho = df[mud_col].fillna(1000.0).to_numpy(dtype=float, copy=True)
         depth = df[depth_col].fillna(0.0).values
-        g = 9.80665
-        # hydrostatic pressure in Pa
-        p_hydro_pa = rho * g * depth
-        pa_to_psi = 0.00014503773773020923
-        p_hydro_psi = p_hydro_pa * pa_to_psi
+        # Hydrostatic psi in one array multiply plus a scalar scale,
+        # reusing rho's buffer instead of chaining rho*g, *depth,
+        # *pa_to_psi full-length temporaries.
+        p_hydro_psi = np.multiply(rho, depth, out=rho)
+        p_hydro_psi *= _G_PA_TO_PSI
     elif 'P_Hydrostatic' in df.columns:
         # If P_Hydrostatic exists assume it's in Pa
-        p_hydro_psi = df['P_Hydrostatic'].fillna(0).values * 0.00014503773773020923
+        p_hydro_psi = df['P_Hydrostatic'].fillna(0).values * _PA_TO_PSI
     else:
         p_hydro_psi = np.zeros(n)
 
@@ -135,6 +283,8 @@ def compute_pore_pressure(df: pd.DataFrame, out_col: str = 'PREDICTED_PORE_PRESS
         dc = df[dc_col].astype(float).values
         # nominal exponent (calibrated ~1.0). Positive anomaly when dc < nominal
         nominal = 1.0
+        # missing exponent readings contribute no anomaly
+        dc = np.where(np.isnan(dc), nominal, dc)
         # scale factor tuned for demo -- 1000 psi per 0.1 deviation
         scale = 1000.0 / 0.1
         anomaly = (nominal - dc) * scale
@@ -146,8 +296,7 @@ def compute_pore_pressure(df: pd.DataFrame, out_col: str = 'PREDICTED_PORE_PRESS
     psi = np.where(np.isfinite(psi), psi, np.nan)
     psi = np.clip(psi, 0.0, None)
 
-    psi_result[:] = psi
-    return psi_result
+    return pd.Series(psi, index=df.index, name=out_col)
 
 
 def compute_all_targets(df: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
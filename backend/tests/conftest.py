@@ -2,11 +2,57 @@ import pytest
 import sys
 import os
 
+try:
+    import matplotlib
+
+    # Pin the headless backend before any module imports pyplot: backend
+    # autodetection probes GUI toolkits, and a consistent backend keeps
+    # matplotlib's font cache (~/.cache/matplotlib) valid across runs so
+    # the multi-second font scan is only ever paid once per machine.
+    matplotlib.use("Agg", force=True)
+except ImportError:
+    matplotlib = None
+
 # Add the project root to the path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Single, idempotent path insertion for the whole suite: every import
+# scans sys.path linearly, so duplicate entries from per-module inserts
+# tax all of them.
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_matplotlib():
+    """Silence the open-figure warning for figure-heavy test modules."""
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return
+    plt.rcParams["figure.max_open_warning"] = 0
 
 
 @pytest.fixture(scope="session")
 def project_root():
     """Return the project root directory"""
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def fs_index(project_root):
+    """Relative paths under the project root, walked once per session.
+
+    Returns {"dirs": set, "files": set} so the structure tests become
+    O(1) membership checks instead of one stat() syscall each. Noise
+    directories are pruned from the walk.
+    """
+    ignore = {".git", "__pycache__", ".pytest_cache", "node_modules", ".venv"}
+    dirs, files = set(), set()
+    for base, subdirs, names in os.walk(project_root):
+        subdirs[:] = [d for d in subdirs if d not in ignore]
+        rel = os.path.relpath(base, project_root)
+        for d in subdirs:
+            dirs.add(os.path.normpath(os.path.join(rel, d)))
+        for n in names:
+            files.add(os.path.normpath(os.path.join(rel, n)))
+    return {"dirs": dirs, "files": files}
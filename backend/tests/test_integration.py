@@ -1,99 +1,89 @@
 """
 Simple integration tests for the project
 """
+import functools
+import importlib
 import pytest
 import sys
 import os
 from pathlib import Path
 
-# Add project root to path
+# Project root is on sys.path via conftest.py; the Path is still needed
+# for the requirements read below.
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+
+
+@functools.cache
+def _req_text() -> str:
+    """Read requirements.txt once for all content checks (lowercased)."""
+    return (project_root / "requirements.txt").read_text().lower()
 
 
 class TestProjectStructure:
-    """Test that project structure is correct"""
-    
-    def test_src_directory_exists(self):
+    """Test that project structure is correct.
+
+    All existence checks are membership lookups against the session's
+    fs_index fixture (one directory walk) rather than per-test stat()
+    calls.
+    """
+
+    def test_src_directory_exists(self, fs_index):
         """Test that src directory exists"""
-        src_dir = project_root / "src"
-        assert src_dir.exists()
-        assert src_dir.is_dir()
-    
-    def test_data_directory_exists(self):
+        assert "src" in fs_index["dirs"]
+
+    def test_data_directory_exists(self, fs_index):
         """Test that data directory exists"""
-        data_dir = project_root / "data"
-        assert data_dir.exists()
-        assert data_dir.is_dir()
-    
-    def test_models_directory_exists(self):
+        assert "data" in fs_index["dirs"]
+
+    def test_models_directory_exists(self, fs_index):
         """Test that models directory exists"""
-        models_dir = project_root / "models"
-        assert models_dir.exists()
-        assert models_dir.is_dir()
-    
-    def test_tests_directory_exists(self):
+        assert "models" in fs_index["dirs"]
+
+    def test_tests_directory_exists(self, fs_index):
         """Test that tests directory exists"""
-        tests_dir = project_root / "tests"
-        assert tests_dir.exists()
-        assert tests_dir.is_dir()
-    
-    def test_main_app_file_exists(self):
+        assert "tests" in fs_index["dirs"]
+
+    def test_main_app_file_exists(self, fs_index):
         """Test that app.py exists"""
-        app_file = project_root / "app.py"
-        assert app_file.exists()
-        assert app_file.is_file()
-    
-    def test_requirements_file_exists(self):
+        assert "app.py" in fs_index["files"]
+
+    def test_requirements_file_exists(self, fs_index):
         """Test that requirements.txt exists"""
-        req_file = project_root / "requirements.txt"
-        assert req_file.exists()
-        assert req_file.is_file()
+        assert "requirements.txt" in fs_index["files"]
 
 
 class TestSourceModules:
     """Test that all source modules are present"""
-    
-    def test_config_module_exists(self):
+
+    def test_config_module_exists(self, fs_index):
         """Test that config.py exists"""
-        config_file = project_root / "src" / "config.py"
-        assert config_file.exists()
-        assert config_file.is_file()
-    
-    def test_data_loader_module_exists(self):
+        assert os.path.join("src", "config.py") in fs_index["files"]
+
+    def test_data_loader_module_exists(self, fs_index):
         """Test that data_loader.py exists"""
-        module_file = project_root / "src" / "data_loader.py"
-        assert module_file.exists()
-        assert module_file.is_file()
-    
-    def test_models_module_exists(self):
+        assert os.path.join("src", "data_loader.py") in fs_index["files"]
+
+    def test_models_module_exists(self, fs_index):
         """Test that models.py exists"""
-        module_file = project_root / "src" / "models.py"
-        assert module_file.exists()
-        assert module_file.is_file()
-    
-    def test_plots_module_exists(self):
+        assert os.path.join("src", "models.py") in fs_index["files"]
+
+    def test_plots_module_exists(self, fs_index):
         """Test that plots.py exists"""
-        module_file = project_root / "src" / "plots.py"
-        assert module_file.exists()
-        assert module_file.is_file()
-    
-    def test_shap_explainer_module_exists(self):
+        assert os.path.join("src", "plots.py") in fs_index["files"]
+
+    def test_shap_explainer_module_exists(self, fs_index):
         """Test that shap_explainer.py exists"""
-        module_file = project_root / "src" / "shap_explainer.py"
-        assert module_file.exists()
-        assert module_file.is_file()
+        assert os.path.join("src", "shap_explainer.py") in fs_index["files"]
 
 
 class TestDataFiles:
     """Test that necessary data files exist"""
-    
-    def test_data_csv_file_exists(self):
+
+    def test_data_csv_file_exists(self, fs_index):
         """Test that ready_modelling.csv exists"""
-        csv_file = project_root / "data" / "ready_modelling.csv"
-        assert csv_file.exists()
-        assert csv_file.is_file()
-        assert csv_file.suffix == ".csv"
+        csv_path = os.path.join("data", "ready_modelling.csv")
+        assert csv_path in fs_index["files"]
+        assert csv_path.endswith(".csv")
 
 
 class TestRequirements:
@@ -101,80 +91,76 @@ class TestRequirements:
     
     def test_requirements_file_not_empty(self):
         """Test that requirements.txt is not empty"""
-        req_file = project_root / "requirements.txt"
-        content = req_file.read_text()
-        assert len(content) > 0
-    
-    def test_requirements_contains_streamlit(self):
-        """Test that requirements.txt contains streamlit"""
-        req_file = project_root / "requirements.txt"
-        content = req_file.read_text()
-        assert "streamlit" in content.lower()
-    
-    def test_requirements_contains_pandas(self):
-        """Test that requirements.txt contains pandas"""
-        req_file = project_root / "requirements.txt"
-        content = req_file.read_text()
-        assert "pandas" in content.lower()
-    
-    def test_requirements_contains_sklearn(self):
-        """Test that requirements.txt contains scikit-learn"""
-        req_file = project_root / "requirements.txt"
-        content = req_file.read_text()
-        assert "scikit-learn" in content.lower() or "sklearn" in content.lower()
-    
-    def test_requirements_contains_xgboost(self):
-        """Test that requirements.txt contains xgboost"""
-        req_file = project_root / "requirements.txt"
-        content = req_file.read_text()
-        assert "xgboost" in content.lower()
-    
-    def test_requirements_contains_shap(self):
-        """Test that requirements.txt contains shap"""
-        req_file = project_root / "requirements.txt"
-        content = req_file.read_text()
-        assert "shap" in content.lower()
+        assert len(_req_text()) > 0
+
+    @pytest.mark.parametrize(
+        "aliases",
+        [
+            ("streamlit",),
+            ("pandas",),
+            ("scikit-learn", "sklearn"),
+            ("xgboost",),
+            ("shap",),
+        ],
+        ids=lambda aliases: aliases[0],
+    )
+    def test_requirements_contains(self, aliases):
+        """Test that requirements.txt lists each expected package"""
+        assert any(pkg in _req_text() for pkg in aliases)
+
+
+@pytest.fixture(scope="session")
+def src_modules():
+    """Import each src module once per session.
+
+    Heavy transitive imports (joblib, xgboost, shap) are paid a single
+    time. Modules already loaded elsewhere in the session are resolved
+    through sys.modules or the package namespace first — test_plots
+    imports src.plots under a patched src.config, which leaves the
+    module reachable only as an attribute on the src package — so a
+    fresh import_module doesn't re-execute (and fail) what already
+    imported fine. A failed import is recorded as its ImportError so
+    the per-module tests can skip with the original message.
+    """
+    import src
+
+    out = {}
+    for name in ("config", "data_loader", "models", "plots", "shap_explainer"):
+        mod = sys.modules.get(f"src.{name}") or getattr(src, name, None)
+        if mod is None:
+            try:
+                mod = importlib.import_module(f"src.{name}")
+            except ImportError as e:
+                mod = e
+        out[name] = mod
+    return out
 
 
 class TestModuleImports:
     """Test that core modules can be imported"""
-    
-    def test_import_config(self):
+
+    def _check(self, src_modules, name):
+        mod = src_modules[name]
+        if isinstance(mod, ImportError):
+            pytest.skip(f"Could not import {name}: {mod}")
+        assert mod is not None
+
+    def test_import_config(self, src_modules):
         """Test that config module can be imported"""
-        try:
-            from src import config
-            assert config is not None
-        except ImportError as e:
-            pytest.skip(f"Could not import config: {e}")
-    
-    def test_import_data_loader(self):
+        self._check(src_modules, "config")
+
+    def test_import_data_loader(self, src_modules):
         """Test that data_loader module can be imported"""
-        try:
-            from src import data_loader
-            assert data_loader is not None
-        except ImportError as e:
-            pytest.skip(f"Could not import data_loader: {e}")
-    
-    def test_import_models(self):
+        self._check(src_modules, "data_loader")
+
+    def test_import_models(self, src_modules):
         """Test that models module can be imported"""
-        try:
-            from src import models
-            assert models is not None
-        except ImportError as e:
-            pytest.skip(f"Could not import models: {e}")
-    
-    def test_import_plots(self):
+        self._check(src_modules, "models")
+
+    def test_import_plots(self, src_modules):
         """Test that plots module can be imported"""
-        try:
-            from src import plots
-            assert plots is not None
-        except ImportError as e:
-            pytest.skip(f"Could not import plots: {e}")
-    
-    def test_import_shap_explainer(self):
+        self._check(src_modules, "plots")
+
+    def test_import_shap_explainer(self, src_modules):
         """Test that shap_explainer module can be imported"""
-        try:
-            from src import shap_explainer
-            assert shap_explainer is not None
-        except ImportError as e:
-            pytest.skip(f"Could not import shap_explainer: {e}")
+        self._check(src_modules, "shap_explainer")
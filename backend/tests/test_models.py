@@ -1,23 +1,70 @@
+import copy
+import functools
+
 import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
-from src.models import ModelManager
-from src.config import FEATURES_POROSITY, FEATURES_FLUID, FEATURES_PRESSURE, MINIMAL_FEATURES
+from backend.services.model_manager import (
+    ModelManager,
+    FEATURES_POROSITY,
+    FEATURES_FLUID,
+    FEATURES_PRESSURE,
+    MINIMAL_FEATURES,
+)
+
+
+@pytest.fixture(scope="session")
+def _base_manager():
+    """Construct the patched ModelManager once per session.
+
+    Re-running __init__ (and re-entering the joblib.load patch) per test
+    is the expensive part; tests get a shallow copy with fresh Mock
+    models so per-test call assertions stay isolated.
+    """
+    with patch('backend.services.model_manager.joblib.load'):
+        return ModelManager()
+
+
+@functools.cache
+def _fresh_df(features: tuple, n_rows: int) -> pd.DataFrame:
+    """Build (and memoize) a test frame per unique (features, n_rows).
+
+    Keyed on a hashable feature tuple so repeated tests over the same
+    shape reuse one seeded construction; callers copy before mutating.
+    """
+    arr = np.random.default_rng(0).random((n_rows, len(features))) * 100
+    df = pd.DataFrame(arr, columns=list(features))
+    if 'DEPTH' in df.columns:
+        df['DEPTH'] = np.linspace(2000, 2100, n_rows)
+    return df
+
+
+@pytest.fixture(scope="module")
+def make_df():
+    """Factory for test dataframes with a given feature list"""
+    def _make(features, n_rows=10):
+        return _fresh_df(tuple(features), n_rows).copy()
+    return _make
 
 
 class TestModelManagerInit:
     """Test ModelManager initialization"""
     
-    @patch('src.models.joblib.load')
+    @patch('backend.services.model_manager.joblib.load')
     def test_model_manager_init(self, mock_load):
         """Test ModelManager initialization with mocked models"""
         # Setup mocks
         mock_porosity_model = Mock()
         mock_fluid_model = Mock()
         mock_pressure_model = Mock()
+        # __init__ caches the pressure booster's feature names, so the
+        # mock must expose an iterable there (a bare Mock is not).
+        mock_pressure_model.get_booster.return_value.feature_names = list(
+            FEATURES_PRESSURE
+        )
         mock_encoder = Mock()
-        
+
         mock_load.side_effect = [
             mock_porosity_model,
             mock_fluid_model,
@@ -40,33 +87,23 @@ class TestModelManagerPredictions:
     """Test ModelManager prediction methods"""
     
     @pytest.fixture
-    def mock_manager(self):
-        """Create a mocked ModelManager for testing"""
-        with patch('src.models.joblib.load'):
-            manager = ModelManager()
-            # Mock the individual models
-            manager.porosity_model = Mock()
-            manager.fluid_model = Mock()
-            manager.pressure_model = Mock()
-            manager.fluid_encoder = Mock()
-            return manager
-    
-    def create_test_dataframe(self, features, n_rows=10):
-        """Helper to create test dataframe with specified features"""
-        data = {}
-        for feat in features:
-            if feat == 'DEPTH':
-                data[feat] = np.linspace(2000, 2100, n_rows)
-            else:
-                data[feat] = np.random.rand(n_rows) * 100
-        return pd.DataFrame(data)
+    def mock_manager(self, _base_manager):
+        """Shallow copy of the shared manager with fresh mocked models"""
+        manager = copy.copy(_base_manager)
+        manager.porosity_model = Mock()
+        manager.fluid_model = Mock()
+        manager.pressure_model = Mock()
+        manager.fluid_encoder = Mock()
+        return manager
     
-    def test_predict_porosity(self, mock_manager):
+    def test_predict_porosity(self, mock_manager, make_df):
         """Test porosity prediction"""
         # Setup
-        mock_manager.porosity_model.predict.return_value = np.array([0.2, 0.25, 0.3] * 4)[:10]
-        
-        df = self.create_test_dataframe(FEATURES_POROSITY, n_rows=10)
+        mock_manager.porosity_model.predict.return_value = np.resize(
+            np.array([0.2, 0.25, 0.3]), 10
+        )
+
+        df = make_df(FEATURES_POROSITY, n_rows=10)
         
         # Execute
         predictions = mock_manager.predict_porosity(df)
@@ -76,14 +113,16 @@ class TestModelManagerPredictions:
         assert len(predictions) == len(df)
         mock_manager.porosity_model.predict.assert_called_once()
     
-    def test_predict_fluid(self, mock_manager):
+    def test_predict_fluid(self, mock_manager, make_df):
         """Test fluid type prediction"""
         # Setup
-        mock_manager.fluid_model.predict.return_value = np.array([0, 1, 0] * 4)[:10]
+        mock_manager.fluid_model.predict.return_value = np.resize(np.array([0, 1, 0]), 10)
         mock_manager.fluid_model.predict_proba.return_value = np.random.rand(10, 3)
-        mock_manager.fluid_encoder.inverse_transform.return_value = np.array(['Oil', 'Water', 'Gas'] * 4)[:10]
-        
-        df = self.create_test_dataframe(FEATURES_FLUID, n_rows=10)
+        mock_manager.fluid_encoder.inverse_transform.return_value = np.resize(
+            np.array(['Oil', 'Water', 'Gas']), 10
+        )
+
+        df = make_df(FEATURES_FLUID, n_rows=10)
         
         # Execute
         fluid_types, probas = mock_manager.predict_fluid(df)
@@ -95,18 +134,21 @@ class TestModelManagerPredictions:
         mock_manager.fluid_model.predict.assert_called_once()
         mock_manager.fluid_model.predict_proba.assert_called_once()
     
-    def test_predict_pressure(self, mock_manager):
+    def test_predict_pressure(self, mock_manager, make_df):
         """Test pore pressure prediction"""
         # Setup
         mock_model = Mock()
         mock_booster = Mock()
         mock_booster.feature_names = FEATURES_PRESSURE
         mock_model.get_booster.return_value = mock_booster
-        mock_model.predict.return_value = np.array([5000 + i*10 for i in range(10)])
+        mock_model.predict.return_value = np.arange(10, dtype=np.float64) * 10 + 5000
         
         mock_manager.pressure_model = mock_model
-        
-        df = self.create_test_dataframe(FEATURES_PRESSURE, n_rows=10)
+        # predict_pressure reads the feature list cached at load time,
+        # so swapping the model means refreshing the cache too.
+        mock_manager._pressure_features = FEATURES_PRESSURE
+
+        df = make_df(FEATURES_PRESSURE, n_rows=10)
         
         # Execute
         predictions = mock_manager.predict_pressure(df)
@@ -116,32 +158,30 @@ class TestModelManagerPredictions:
         assert len(predictions) == len(df)
         assert all(pred >= 0 for pred in predictions)
     
-    def test_safe_select_with_all_features(self, mock_manager):
-        """Test _safe_select with all features available"""
-        df = self.create_test_dataframe(FEATURES_POROSITY)
-        
-        # Execute
-        selected = mock_manager._safe_select(df, FEATURES_POROSITY, "porosity")
-        
-        # Verify
-        assert isinstance(selected, pd.DataFrame)
-        assert all(feat in selected.columns for feat in FEATURES_POROSITY)
-    
-    def test_safe_select_with_missing_features(self, mock_manager):
-        """Test _safe_select with missing features"""
-        # Create dataframe with only minimal features
-        df = self.create_test_dataframe(MINIMAL_FEATURES)
-        
+    @pytest.mark.parametrize(
+        "df_feats,expect_full",
+        [
+            (FEATURES_POROSITY, True),   # all features available
+            (MINIMAL_FEATURES, False),   # falls back to minimal set
+        ],
+        ids=["all_features", "missing_features"],
+    )
+    def test_safe_select(self, mock_manager, make_df, df_feats, expect_full):
+        """Test _safe_select with full and degraded feature availability"""
+        df = make_df(df_feats)
+
         # Execute
         selected = mock_manager._safe_select(df, FEATURES_POROSITY, "porosity")
-        
+
         # Verify
         assert isinstance(selected, pd.DataFrame)
         assert len(selected) > 0
-    
-    def test_safe_select_force_full(self, mock_manager):
+        if expect_full:
+            assert all(feat in selected.columns for feat in FEATURES_POROSITY)
+
+    def test_safe_select_force_full(self, mock_manager, make_df):
         """Test _safe_select with force_full=True"""
-        df = self.create_test_dataframe(['DEPTH', 'GR'], n_rows=5)
+        df = make_df(['DEPTH', 'GR'], n_rows=5)
         
         # Execute
         selected = mock_manager._safe_select(df, FEATURES_POROSITY, "porosity", force_full=True)
@@ -154,25 +194,24 @@ class TestModelManagerPredictions:
 class TestModelManagerDataHandling:
     """Test data handling in ModelManager"""
     
-    @patch('src.models.joblib.load')
+    @patch('backend.services.model_manager.joblib.load')
     def test_nan_handling_in_predictions(self, mock_load):
         """Test that NaN values are properly handled"""
-        with patch('src.models.joblib.load'):
+        with patch('backend.services.model_manager.joblib.load'):
             manager = ModelManager()
             manager.porosity_model = Mock()
             manager.porosity_model.predict.return_value = np.array([0.2] * 5)
             
-            # Create dataframe with NaN values
-            data = {
-                'DEPTH': [2000, 2010, 2020, 2030, 2040],
-                'Feature1': [1.0, np.nan, 3.0, np.nan, 5.0],
-                'Feature2': [10, 20, 30, 40, 50],
-            }
-            for feat in FEATURES_POROSITY:
-                if feat not in data:
-                    data[feat] = np.random.rand(5) * 100
-            
-            df = pd.DataFrame(data)
+            # Create dataframe with NaN values: one vectorized fill over
+            # the full feature set, then NaNs punched into the first
+            # non-DEPTH column by row index.
+            n = 5
+            cols = list(FEATURES_POROSITY)
+            arr = np.random.default_rng(1).random((n, len(cols))) * 100
+            df = pd.DataFrame(arr, columns=cols)
+            df['DEPTH'] = np.arange(n) * 10 + 2000
+            nan_col = next(c for c in cols if c != 'DEPTH')
+            df.loc[[1, 3], nan_col] = np.nan
             
             # Execute - should handle NaNs
             predictions = manager.predict_porosity(df)
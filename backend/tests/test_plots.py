@@ -1,12 +1,26 @@
+import sys
+
 import pytest
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Headless raster backend: tests never display figures, and a GUI
+# backend would spin up window/figure-manager machinery per plot.
+matplotlib.use("Agg", force=True)
 import matplotlib.pyplot as plt
 from unittest.mock import Mock, patch
 
-# Mock config before importing plot_well_logs
-with patch.dict('sys.modules', {'src.config': Mock()}):
+# Mock config before importing plot_well_logs. Inserted and removed by
+# hand rather than via patch.dict: patch.dict restores the whole
+# sys.modules snapshot on exit, which would evict every module the
+# src.plots import pulled in (seaborn, scipy, ...) and break later
+# re-imports of their C extensions elsewhere on the same worker.
+sys.modules['src.config'] = Mock()
+try:
     from src.plots import plot_well_logs
+finally:
+    del sys.modules['src.config']
 
 # Define column names for tests
 COL_DEPTH = 'DEPTH'
@@ -22,37 +36,49 @@ COL_TORQUE = 'Surface Torque Average N.m'
 class TestPlotWellLogs:
     """Test suite for plot_well_logs function"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_dataframe(self):
-        """Create a sample dataframe for testing"""
+        """Create a sample dataframe, built once per module.
+
+        Module scope amortizes the RNG and DataFrame construction across
+        the read-only tests; any test that mutates must .copy() first.
+        """
         n_points = 100
+        rng = np.random.default_rng(0)
         data = {
             COL_DEPTH: np.linspace(2000, 2100, n_points),
-            COL_GAMMA_RAY: np.random.rand(n_points) * 150,
-            COL_RESISTIVITY: np.random.rand(n_points) * 100 + 1,
-            COL_POROSITY: np.random.rand(n_points) * 0.3,
-            COL_FLUID_CLASS: np.random.choice(['Oil', 'Water', 'Gas'], n_points),
-            COL_PORE_PRESSURE: np.random.rand(n_points) * 10000 + 2000,
-            COL_WOB: np.random.rand(n_points) * 100000,
-            COL_TORQUE: np.random.rand(n_points) * 50000,
+            COL_GAMMA_RAY: rng.random(n_points) * 150,
+            COL_RESISTIVITY: rng.random(n_points) * 100 + 1,
+            COL_POROSITY: rng.random(n_points) * 0.3,
+            COL_FLUID_CLASS: rng.choice(['Oil', 'Water', 'Gas'], n_points),
+            COL_PORE_PRESSURE: rng.random(n_points) * 10000 + 2000,
+            COL_WOB: rng.random(n_points) * 100000,
+            COL_TORQUE: rng.random(n_points) * 50000,
         }
-        return pd.DataFrame(data)
-    
-    def test_plot_well_logs_returns_figure(self, sample_dataframe):
-        """Test that plot_well_logs returns a matplotlib figure"""
+        # Columns are already typed ndarrays; skip the defensive copy
+        return pd.DataFrame(data, copy=False)
+
+    @pytest.fixture(scope="module")
+    def base_fig(self, sample_dataframe):
+        """One shared default figure for the structural assertions.
+
+        Figure construction (6 axes, tick formatters) dominates these
+        tests; the read-only checks on the default plot share a single
+        build instead of re-plotting per test.
+        """
         fig = plot_well_logs(sample_dataframe)
-        
-        assert fig is not None
-        assert hasattr(fig, 'axes')
+        yield fig
         plt.close(fig)
-    
-    def test_plot_well_logs_creates_multiple_tracks(self, sample_dataframe):
+
+    def test_plot_well_logs_returns_figure(self, base_fig):
+        """Test that plot_well_logs returns a matplotlib figure"""
+        assert base_fig is not None
+        assert hasattr(base_fig, 'axes')
+
+    def test_plot_well_logs_creates_multiple_tracks(self, base_fig):
         """Test that plot creates multiple subplots (tracks)"""
-        fig = plot_well_logs(sample_dataframe)
-        
         # Should have 6 tracks
-        assert len(fig.axes) == 6
-        plt.close(fig)
+        assert len(base_fig.axes) == 6
     
     def test_plot_well_logs_with_depth_range(self, sample_dataframe):
         """Test plot with depth range filtering"""
@@ -88,7 +114,7 @@ class TestPlotWellLogs:
         df = pd.DataFrame({
             COL_DEPTH: np.linspace(2000, 2100, 10),
             'SomeOtherColumn': np.random.rand(10)
-        })
+        }, copy=False)
         
         fig = plot_well_logs(df)
         
@@ -97,23 +123,21 @@ class TestPlotWellLogs:
     
     def test_plot_well_logs_with_nan_values(self, sample_dataframe):
         """Test plot handles NaN values"""
-        # Introduce some NaN values
-        sample_dataframe.loc[10:20, COL_GAMMA_RAY] = np.nan
-        sample_dataframe.loc[30:40, COL_RESISTIVITY] = np.nan
-        
-        fig = plot_well_logs(sample_dataframe)
+        # Copy before mutating: the fixture frame is shared module-wide
+        df = sample_dataframe.copy()
+        df.loc[10:20, COL_GAMMA_RAY] = np.nan
+        df.loc[30:40, COL_RESISTIVITY] = np.nan
+
+        fig = plot_well_logs(df)
         
         assert fig is not None
         assert len(fig.axes) == 6
         plt.close(fig)
     
-    def test_plot_well_logs_title(self, sample_dataframe):
+    def test_plot_well_logs_title(self, base_fig):
         """Test that plot has appropriate title"""
-        fig = plot_well_logs(sample_dataframe)
-        
         # Check that figure has a title
-        assert fig._suptitle is not None
-        plt.close(fig)
+        assert base_fig._suptitle is not None
 
 
 class TestPlotEdgeCases:
@@ -149,7 +173,7 @@ class TestPlotEdgeCases:
             COL_DEPTH: np.linspace(2000, 2100, 10),
             COL_GAMMA_RAY: np.full(10, np.nan),
             COL_RESISTIVITY: np.random.rand(10) * 100,
-        })
+        }, copy=False)
         
         fig = plot_well_logs(df)
         
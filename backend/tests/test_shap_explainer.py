@@ -1,40 +1,81 @@
 import pytest
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Headless raster backend: tests never display figures, and a GUI
+# backend would spin up window/figure-manager machinery per plot.
+matplotlib.use("Agg", force=True)
 import matplotlib.pyplot as plt
 from unittest.mock import Mock, patch, MagicMock
 import xgboost as xgb
-from src.shap_explainer import explain_model
+from backend.services.shap_explainer import explain_model
+
+
+@pytest.fixture(scope="module")
+def rng_pool():
+    """Frozen random arrays generated once and shared across the tests.
+
+    Every consumer treats these as read-only inputs, so one seeded
+    default_rng fill replaces the per-test np.random.rand allocations
+    (and the global Mersenne Twister state mutation they imply).
+    """
+    rng = np.random.default_rng(42)
+    return {
+        "X20x8": rng.random((20, 8)),
+        "X20x50": rng.random((20, 50)),
+        "pred20": rng.random(20),
+        "shap20x8": rng.random((20, 8)),
+    }
+
+
+@pytest.fixture(scope="module")
+def _model_template(rng_pool):
+    """One generic mocked model shared by the non-XGBoost-path tests.
+
+    Mock construction (spec walks, __getattr__ bookkeeping) is paid once;
+    the function-scope wrapper below resets call state per test. A plain
+    Mock is deliberate — an autospec of XGBRegressor would pass the
+    isinstance(model, xgb.XGBModel) check and flip these tests onto the
+    tree-explainer branch.
+    """
+    model = Mock()
+    model.predict = Mock(return_value=rng_pool["pred20"])
+    return model
+
+
+@pytest.fixture
+def generic_model(_model_template):
+    """The shared mocked model with per-test call state"""
+    _model_template.reset_mock()
+    return _model_template
 
 
 class TestSHAPExplainer:
     """Test suite for SHAP explainer"""
-    
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample data for SHAP testing"""
-        n_samples = 20
+
+    @pytest.fixture(scope="module")
+    def sample_data(self, rng_pool):
+        """Create sample data for SHAP testing, built once per module"""
         n_features = 8
-        data = np.random.rand(n_samples, n_features)
         feature_names = [f'Feature_{i}' for i in range(n_features)]
-        return pd.DataFrame(data, columns=feature_names), feature_names
-    
-    @pytest.fixture
-    def mock_xgb_model(self):
+        return pd.DataFrame(rng_pool["X20x8"], columns=feature_names), feature_names
+
+    @pytest.fixture(scope="module")
+    def mock_xgb_model(self, rng_pool):
         """Create a mocked XGBoost model"""
         model = Mock(spec=xgb.XGBRegressor)
-        model.predict = Mock(return_value=np.random.rand(20))
+        model.predict = Mock(return_value=rng_pool["pred20"])
         return model
     
-    def test_explain_model_with_xgb_model(self, sample_data, mock_xgb_model):
+    def test_explain_model_with_xgb_model(self, sample_data, mock_xgb_model, rng_pool):
         """Test explain_model with XGBoost model"""
         X_sample, feature_names = sample_data
-        
-        with patch('src.shap_explainer.shap.TreeExplainer') as mock_explainer:
+
+        with patch('backend.services.shap_explainer.shap.TreeExplainer') as mock_explainer:
             # Setup mock explainer
             mock_exp_instance = Mock()
-            mock_shap_values = np.random.rand(20, 8)
-            mock_exp_instance.shap_values.return_value = mock_shap_values
+            mock_exp_instance.shap_values.return_value = rng_pool["shap20x8"]
             mock_explainer.return_value = mock_exp_instance
             
             # Make model instance of XGBModel
@@ -46,53 +87,45 @@ class TestSHAPExplainer:
             assert hasattr(fig, 'axes')
             plt.close(fig)
     
-    def test_explain_model_returns_figure(self, sample_data):
+    def test_explain_model_returns_figure(self, sample_data, generic_model):
         """Test that explain_model returns a matplotlib figure"""
         X_sample, feature_names = sample_data
-        model = Mock()
-        model.predict = Mock(return_value=np.random.rand(20))
-        
-        with patch('src.shap_explainer.shap.Explainer'):
-            fig = explain_model(model, X_sample, feature_names, "Test")
+
+        with patch('backend.services.shap_explainer.shap.Explainer'):
+            fig = explain_model(generic_model, X_sample, feature_names, "Test")
             
             assert fig is not None
             assert hasattr(fig, 'axes')
             plt.close(fig)
     
-    def test_explain_model_with_none_feature_names(self, sample_data):
+    def test_explain_model_with_none_feature_names(self, sample_data, generic_model):
         """Test explain_model with None feature names"""
         X_sample, _ = sample_data
-        model = Mock()
-        model.predict = Mock(return_value=np.random.rand(20))
-        
-        with patch('src.shap_explainer.shap.Explainer'):
-            fig = explain_model(model, X_sample, None, "Test")
+
+        with patch('backend.services.shap_explainer.shap.Explainer'):
+            fig = explain_model(generic_model, X_sample, None, "Test")
             
             assert fig is not None
             plt.close(fig)
     
-    def test_explain_model_with_numpy_array(self):
+    def test_explain_model_with_numpy_array(self, rng_pool, generic_model):
         """Test explain_model with numpy array input"""
-        X_sample = np.random.rand(20, 8)
+        X_sample = rng_pool["X20x8"]
         feature_names = [f'Feature_{i}' for i in range(8)]
-        model = Mock()
-        model.predict = Mock(return_value=np.random.rand(20))
-        
-        with patch('src.shap_explainer.shap.Explainer'):
-            fig = explain_model(model, X_sample, feature_names, "Test")
+
+        with patch('backend.services.shap_explainer.shap.Explainer'):
+            fig = explain_model(generic_model, X_sample, feature_names, "Test")
             
             assert fig is not None
             plt.close(fig)
     
-    def test_explain_model_title(self, sample_data):
+    def test_explain_model_title(self, sample_data, generic_model):
         """Test that explain_model sets correct title"""
         X_sample, feature_names = sample_data
-        model = Mock()
-        model.predict = Mock(return_value=np.random.rand(20))
         title_text = "Custom SHAP Analysis"
-        
-        with patch('src.shap_explainer.shap.Explainer'):
-            fig = explain_model(model, X_sample, feature_names, title_text)
+
+        with patch('backend.services.shap_explainer.shap.Explainer'):
+            fig = explain_model(generic_model, X_sample, feature_names, title_text)
             
             assert fig is not None
             # Note: title verification would depend on how plt.title sets it
@@ -103,7 +136,7 @@ class TestSHAPExplainer:
         X_sample, feature_names = sample_data
         model = Mock()
         
-        with patch('src.shap_explainer.shap.Explainer') as mock_explainer:
+        with patch('backend.services.shap_explainer.shap.Explainer') as mock_explainer:
             # Make the explainer raise an error
             mock_explainer.side_effect = Exception("SHAP error")
             
@@ -113,20 +146,15 @@ class TestSHAPExplainer:
             assert fig is not None
             plt.close(fig)
     
-    def test_explain_model_multiclass_shap_values(self, sample_data):
+    def test_explain_model_multiclass_shap_values(self, sample_data, rng_pool):
         """Test explain_model handles multiclass SHAP values"""
         X_sample, feature_names = sample_data
         model = Mock(spec=xgb.XGBClassifier)
-        
-        with patch('src.shap_explainer.shap.TreeExplainer') as mock_explainer:
+
+        with patch('backend.services.shap_explainer.shap.TreeExplainer') as mock_explainer:
             mock_exp_instance = Mock()
             # Return list of shap values (multiclass case)
-            mock_shap_values = [
-                np.random.rand(20, 8),
-                np.random.rand(20, 8),
-                np.random.rand(20, 8)
-            ]
-            mock_exp_instance.shap_values.return_value = mock_shap_values
+            mock_exp_instance.shap_values.return_value = [rng_pool["shap20x8"]] * 3
             mock_explainer.return_value = mock_exp_instance
             
             # Make model instance of XGBModel
@@ -151,36 +179,32 @@ class TestSHAPExplainerEdgeCases:
         model = Mock()
         model.predict = Mock(return_value=np.array([0.5]))
         
-        with patch('src.shap_explainer.shap.Explainer'):
+        with patch('backend.services.shap_explainer.shap.Explainer'):
             fig = explain_model(model, X_sample, ['Feature_0', 'Feature_1', 'Feature_2'])
             
             assert fig is not None
             plt.close(fig)
     
-    def test_explain_model_single_feature(self):
+    def test_explain_model_single_feature(self, rng_pool, generic_model):
         """Test explain_model with single feature"""
         X_sample = pd.DataFrame({
-            'Feature_0': np.random.rand(20)
+            'Feature_0': rng_pool["pred20"]
         })
-        model = Mock()
-        model.predict = Mock(return_value=np.random.rand(20))
-        
-        with patch('src.shap_explainer.shap.Explainer'):
-            fig = explain_model(model, X_sample, ['Feature_0'])
+
+        with patch('backend.services.shap_explainer.shap.Explainer'):
+            fig = explain_model(generic_model, X_sample, ['Feature_0'])
             
             assert fig is not None
             plt.close(fig)
     
-    def test_explain_model_many_features(self):
+    def test_explain_model_many_features(self, rng_pool, generic_model):
         """Test explain_model with many features"""
         n_features = 50
-        X_sample = np.random.rand(20, n_features)
+        X_sample = rng_pool["X20x50"]
         feature_names = [f'Feature_{i}' for i in range(n_features)]
-        model = Mock()
-        model.predict = Mock(return_value=np.random.rand(20))
-        
-        with patch('src.shap_explainer.shap.Explainer'):
-            fig = explain_model(model, X_sample, feature_names)
+
+        with patch('backend.services.shap_explainer.shap.Explainer'):
+            fig = explain_model(generic_model, X_sample, feature_names)
             
             assert fig is not None
             plt.close(fig)
@@ -6,6 +6,9 @@ Tests cover:
 - Rule-based fluid classification
 - Simplified pore pressure estimation (Rehm & McClendon style)
 """
+import functools
+import math
+
 import pytest
 import pandas as pd
 import numpy as np
@@ -18,38 +21,71 @@ from src.targets import (
 )
 
 
+# Log-column names used throughout the fixtures, lifted to constants so
+# each name is interned once instead of re-hashed per dict literal.
+_RHOB = 'Bulk Density - Compensated kg/m3'
+_NPHI = 'Neutron Porosity (Sandstone) Euc'
+_RES = 'Resistivity Phase - Corrected - 2MHz ohm.m'
+_GAS = 'Chrom 1 Total Gas Euc'
+_MW = 'Mud Weight In kg/m3'
+_DXC = 'Corrected Drilling Exponent unitless'
+
+
+def _mk(cols_values):
+    """Build a numeric test frame from pre-typed float64 arrays.
+
+    Stacking the columns into one (n, k) float64 array up front gives
+    pandas a single consolidated block — no per-element dtype inference,
+    no per-column 1-D blocks to consolidate later — and ``copy=False``
+    skips the defensive copy. On the 1-7 row frames used here that
+    construction overhead dominates the functions under test.
+    """
+    values = np.column_stack(
+        [np.asarray(v, dtype=np.float64) for v in cols_values.values()]
+    )
+    return pd.DataFrame(values, columns=list(cols_values), copy=False)
+
+
+@pytest.fixture(scope="session")
+def full_df():
+    """Canonical all-columns frame, built once per session.
+
+    DataFrame construction (dict -> BlockManager + dtype inference) costs
+    more than the target functions under test, so scenario rows are
+    crafted here and tests select them with ``.iloc[...]``/``.copy()``
+    instead of rebuilding small frames. Rows 0-4 encode the fluid-class
+    scenarios (reservoir via resistivity, reservoir via gas, pay zone via
+    resistivity, pay zone via gas, background); rows 5-6 carry NaN
+    resistivity/gas.
+    """
+    return _mk({
+        'DEPTH': [2000.0, 2100.0, 2200.0, 2300.0, 2400.0, 2500.0, 2600.0],
+        _RHOB: [2200.0, 2250.0] + [2300.0] * 5,
+        _NPHI: [0.2, 0.25] + [0.2] * 5,
+        _RES: [150.0, 10.0, 30.0, 10.0, 5.0, np.nan, 30.0],
+        _GAS: [5.0, 100.0, 5.0, 20.0, 2.0, 5.0, np.nan],
+        _MW: [1200.0] * 7,
+        _DXC: [1.0] * 7,
+        'PHI_COMBINED': [0.2, 0.1, 0.2, 0.2, 0.05, 0.2, 0.2],
+    })
+
+
 class TestPhiFromDensity:
     """Test Wyllie-style porosity calculation from bulk density."""
 
-    def test_zero_porosity(self):
-        """Test dense rock (zero porosity)."""
-        rho_bulk = 2650.0  # Matrix density
-        phi = _phi_from_density(rho_bulk)
-        assert phi == 0.0
-
-    def test_full_porosity(self):
-        """Test fully fluid-filled (100% porosity)."""
-        rho_bulk = 1000.0  # Fluid density
-        phi = _phi_from_density(rho_bulk)
-        assert phi == 1.0
+    def test_porosity_values(self):
+        """Test the scalar cases batched through one vectorized call.
 
-    def test_moderate_porosity(self):
-        """Test intermediate porosity."""
-        rho_bulk = 2200.0  # Typical sandstone
+        Dense rock (zero porosity), fully fluid-filled, typical
+        sandstone, and both out-of-range clips — one array in, one
+        element-wise assertion, instead of five scalar invocations.
+        """
+        rho_bulk = np.array([2650.0, 1000.0, 2200.0, 500.0, 3000.0])
+        expected = [0.0, 1.0, (2650.0 - 2200.0) / (2650.0 - 1000.0), 1.0, 0.0]
         phi = _phi_from_density(rho_bulk, rho_matrix=2650.0, rho_fluid=1000.0)
-        expected = (2650.0 - 2200.0) / (2650.0 - 1000.0)  # ~0.276
-        assert abs(phi - expected) < 0.01
-
-    def test_clipped_to_range(self):
-        """Test that porosity is clipped to [0, 1]."""
-        # Very low density (physically impossible)
-        phi_high = _phi_from_density(500.0)
-        assert phi_high == 1.0  # Clipped to max
-
-        # Very high density (physically impossible)
-        phi_low = _phi_from_density(3000.0)
-        assert phi_low == 0.0  # Clipped to min
+        np.testing.assert_allclose(phi, expected)
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
     def test_nan_handling(self):
         """Test handling of NaN values."""
         rho_bulk = np.array([2200.0, np.nan, 2300.0])
@@ -57,264 +93,259 @@ class TestPhiFromDensity:
         assert np.isfinite(phi[0]) and np.isfinite(phi[2])
         assert np.isnan(phi[1])
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _rho_array(n, seed=0):
+        """Memoize the random density draw per size.
+
+        Callers treat the cached array as read-only; PRNG generation of
+        the 1e6-element case is the dominant cost of this test and only
+        needs paying once per run.
+        """
+        return np.random.default_rng(seed).uniform(1000.0, 2650.0, n)
+
+    @pytest.mark.parametrize("n", [1, 1000, 1_000_000])
+    def test_vectorized_input_sizes(self, n):
+        """Test shape and range hold from scalar-sized up to large arrays.
+
+        The large case keeps the compiled-kernel path (numba, when
+        installed) exercised in CI rather than only the tiny inputs the
+        unit tests feed it.
+        """
+        phi = _phi_from_density(self._rho_array(n))
+        assert phi.shape == (n,)
+        assert ((phi >= 0) & (phi <= 1)).all()
+
 
 class TestComputePhiCombined:
     """Test composite porosity calculation."""
 
     def test_single_density_log(self):
         """Test porosity from density log only."""
-        df = pd.DataFrame({
-            'Bulk Density - Compensated kg/m3': [2200.0, 2300.0, 2400.0]
+        df = _mk({
+            _RHOB: [2200.0, 2300.0, 2400.0]
         })
         phi = compute_phi_combined(df)
         assert len(phi) == 3
-        assert all(0 <= p <= 1 for p in phi if np.isfinite(p))
+        finite = phi[np.isfinite(phi)]
+        assert ((finite >= 0) & (finite <= 1)).all()
 
     def test_single_neutron_log(self):
         """Test porosity from neutron log only."""
-        df = pd.DataFrame({
-            'Neutron Porosity (Sandstone) Euc': [0.2, 0.25, 0.3]
+        df = _mk({
+            _NPHI: [0.2, 0.25, 0.3]
         })
         phi = compute_phi_combined(df)
         assert len(phi) == 3
-        assert all(np.isclose(p, expected) for p, expected in
-                  zip(phi, [0.2, 0.25, 0.3]))
+        np.testing.assert_allclose(phi, [0.2, 0.25, 0.3])
 
     def test_percent_neutron_conversion(self):
         """Test conversion of neutron porosity from percent to fraction."""
-        df = pd.DataFrame({
-            'Neutron Porosity (Sandstone) Euc': [20.0, 25.0, 30.0]  # percent
+        df = _mk({
+            _NPHI: [20.0, 25.0, 30.0]  # percent
         })
         phi = compute_phi_combined(df)
         assert len(phi) == 3
-        assert all(0 <= p <= 1 for p in phi)
+        assert ((phi >= 0) & (phi <= 1)).all()
 
     def test_combined_density_and_neutron(self):
         """Test composite from both density and neutron logs."""
-        df = pd.DataFrame({
-            'Bulk Density - Compensated kg/m3': [2200.0],  # ~0.276 phi
-            'Neutron Porosity (Sandstone) Euc': [0.35]      # 0.35 phi
+        df = _mk({
+            _RHOB: [2200.0],  # ~0.276 phi
+            _NPHI: [0.35]      # 0.35 phi
         })
         phi = compute_phi_combined(df)
         # Should be average
         expected = (0.276 + 0.35) / 2
-        assert abs(phi[0] - expected) < 0.05
+        assert math.isclose(float(phi.iloc[0]), expected, abs_tol=0.05)
 
     def test_missing_both_logs(self):
         """Test with no relevant columns."""
-        df = pd.DataFrame({'OTHER': [1.0, 2.0]})
+        df = _mk({'OTHER': [1.0, 2.0]})
         phi = compute_phi_combined(df)
-        assert all(np.isnan(p) for p in phi)
+        assert np.isnan(phi).all()
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
     def test_nan_values_ignored(self):
         """Test that NaN values are ignored in composite."""
-        df = pd.DataFrame({
-            'Bulk Density - Compensated kg/m3': [2200.0, np.nan],
-            'Neutron Porosity (Sandstone) Euc': [0.3, 0.35]
+        df = _mk({
+            _RHOB: [2200.0, np.nan],
+            _NPHI: [0.3, 0.35]
         })
         phi = compute_phi_combined(df)
         assert len(phi) == 2
-        assert np.isfinite(phi[0])
-        assert np.isfinite(phi[1])
+        assert np.isfinite(phi).all()
 
 
 class TestComputeFluidClass:
     """Test rule-based fluid classification."""
 
-    def test_high_resistivity_reservoir(self):
-        """Test high resistivity -> Potential Reservoir."""
-        df = pd.DataFrame({
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [150.0],
-            'Chrom 1 Total Gas Euc': [5.0],
-            'PHI_COMBINED': [0.2]
-        })
-        fluid = compute_fluid_class(df)
-        assert fluid[0] == 'Potential Reservoir'
-
-    def test_high_gas_with_porosity(self):
-        """Test high gas + porosity -> Potential Reservoir."""
-        df = pd.DataFrame({
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [10.0],
-            'Chrom 1 Total Gas Euc': [100.0],
-            'PHI_COMBINED': [0.1]
-        })
-        fluid = compute_fluid_class(df)
-        assert fluid[0] == 'Potential Reservoir'
-
-    def test_moderate_resistivity_pay_zone(self):
-        """Test moderate resistivity -> Pay Zone."""
-        df = pd.DataFrame({
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [30.0],
-            'Chrom 1 Total Gas Euc': [5.0],
-            'PHI_COMBINED': [0.2]
-        })
-        fluid = compute_fluid_class(df)
-        assert fluid[0] == 'Pay Zone'
-
-    def test_moderate_gas_pay_zone(self):
-        """Test moderate gas -> Pay Zone."""
-        df = pd.DataFrame({
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [10.0],
-            'Chrom 1 Total Gas Euc': [20.0],
-            'PHI_COMBINED': [0.2]
-        })
-        fluid = compute_fluid_class(df)
-        assert fluid[0] == 'Pay Zone'
-
-    def test_background_low_values(self):
-        """Test low values -> Background."""
-        df = pd.DataFrame({
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [5.0],
-            'Chrom 1 Total Gas Euc': [2.0],
-            'PHI_COMBINED': [0.05]
-        })
-        fluid = compute_fluid_class(df)
-        assert fluid[0] == 'Background'
-
-    def test_missing_resistivity_and_gas(self):
+    _FLUID_COLS = [_RES, _GAS, 'PHI_COMBINED']
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_classification_scenarios(self, full_df):
+        """Test all rule branches with one batched call.
+
+        One 7-row invocation replaces seven 1-row ones: high resistivity
+        and high gas+porosity -> Potential Reservoir, moderate
+        resistivity and moderate gas -> Pay Zone, low values ->
+        Background, and the two NaN rows fall back to whichever rule the
+        remaining log still satisfies.
+        """
+        fluid = compute_fluid_class(full_df[self._FLUID_COLS])
+        # Lock in the categorical representation: int8 codes over a fixed
+        # category order, not an object column of Python strings
+        assert isinstance(fluid.dtype, pd.CategoricalDtype)
+        assert fluid.cat.categories.tolist() == [
+            'Background', 'Pay Zone', 'Potential Reservoir'
+        ]
+        assert fluid.tolist() == [
+            'Potential Reservoir',  # resistivity 150
+            'Potential Reservoir',  # gas 100 with porosity
+            'Pay Zone',             # resistivity 30
+            'Pay Zone',             # gas 20
+            'Background',           # all low
+            'Background',           # NaN resistivity, low gas
+            'Pay Zone',             # NaN gas, moderate resistivity
+        ]
+
+    def test_missing_resistivity_and_gas(self, full_df):
         """Test with no resistivity/gas -> Background."""
-        df = pd.DataFrame({'PHI_COMBINED': [0.2]})
-        fluid = compute_fluid_class(df)
-        assert fluid[0] == 'Background'
+        fluid = compute_fluid_class(full_df[['PHI_COMBINED']].iloc[[0]])
+        assert fluid.iloc[0] == 'Background'
 
-    def test_nan_handling(self):
-        """Test NaN values handled gracefully."""
-        df = pd.DataFrame({
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [np.nan, 30.0],
-            'Chrom 1 Total Gas Euc': [5.0, np.nan],
-            'PHI_COMBINED': [0.2, 0.2]
-        })
-        fluid = compute_fluid_class(df)
-        assert len(fluid) == 2
+
+@pytest.fixture(scope="module")
+def pp():
+    """Pore pressure for every scenario row, computed once."""
+    df = _mk({
+        'DEPTH': [1000.0, 2000.0, 3000.0, 2000.0, 100.0, 1000.0, 1000.0],
+        _MW: [1200.0, 1200.0, 1200.0, 1200.0, 1000.0, np.nan, 1200.0],
+        _DXC: [1.0, 1.0, 1.0, 0.8, 2.0, 1.0, np.nan]
+    })
+    return compute_pore_pressure(df).to_numpy()
 
 
 class TestComputePorePressure:
-    """Test simplified pore pressure estimation."""
+    """Test simplified pore pressure estimation.
+
+    All scenarios are encoded as rows of one frame and run through a
+    single vectorized call; the per-scenario tests assert against slices
+    of the cached result instead of each dispatching a 1-row call.
+    """
 
-    def test_hydrostatic_basic(self):
+    def test_hydrostatic_basic(self, pp):
         """Test basic hydrostatic pressure calculation."""
-        df = pd.DataFrame({
-            'DEPTH': [1000.0],  # 1 km depth
-            'Mud Weight In kg/m3': [1200.0],
-            'Corrected Drilling Exponent unitless': [1.0]
-        })
-        pp = compute_pore_pressure(df)
-        assert len(pp) == 1
+        assert len(pp) == 7
         assert pp[0] > 0  # Pressure should be positive
 
-    def test_depth_increases_pressure(self):
+    def test_depth_increases_pressure(self, pp):
         """Test that deeper wells have higher pressure."""
-        df = pd.DataFrame({
-            'DEPTH': [1000.0, 2000.0, 3000.0],
-            'Mud Weight In kg/m3': [1200.0, 1200.0, 1200.0],
-            'Corrected Drilling Exponent unitless': [1.0, 1.0, 1.0]
-        })
-        pp = compute_pore_pressure(df)
-        assert pp[0] < pp[1] < pp[2]
+        # Rows 0-2: same mud weight and exponent, increasing depth
+        np.testing.assert_array_less(pp[:2], pp[1:3])
 
-    def test_anomaly_from_low_exponent(self):
+    def test_anomaly_from_low_exponent(self, pp):
         """Test low drilling exponent increases pressure anomaly."""
-        df_nominal = pd.DataFrame({
-            'DEPTH': [2000.0],
-            'Mud Weight In kg/m3': [1200.0],
-            'Corrected Drilling Exponent unitless': [1.0]
-        })
-        df_low_exp = pd.DataFrame({
-            'DEPTH': [2000.0],
-            'Mud Weight In kg/m3': [1200.0],
-            'Corrected Drilling Exponent unitless': [0.8]
-        })
-        pp_nominal = compute_pore_pressure(df_nominal)[0]
-        pp_low = compute_pore_pressure(df_low_exp)[0]
-        assert pp_low > pp_nominal  # Low exponent -> higher pressure
+        # Row 3 matches row 1 except for exponent 0.8 vs 1.0
+        assert pp[3] > pp[1]  # Low exponent -> higher pressure
 
-    def test_no_negative_pressure(self):
+    def test_no_negative_pressure(self, pp):
         """Test that pressure is never negative."""
-        df = pd.DataFrame({
-            'DEPTH': [100.0],
-            'Mud Weight In kg/m3': [1000.0],
-            'Corrected Drilling Exponent unitless': [2.0]  # High exponent (anomaly)
-        })
-        pp = compute_pore_pressure(df)
-        assert pp[0] >= 0
+        # Row 4: shallow depth with high exponent (anomaly)
+        assert pp[4] >= 0
 
-    def test_missing_mud_weight_fallback(self):
+    def test_missing_mud_weight_fallback(self, pp):
         """Test fallback to water density when mud weight missing."""
-        df = pd.DataFrame({
-            'DEPTH': [1000.0],
-            'Mud Weight In kg/m3': [np.nan],
-            'Corrected Drilling Exponent unitless': [1.0]
-        })
-        pp = compute_pore_pressure(df)
-        assert np.isfinite(pp[0])
+        assert np.isfinite(pp[5])
 
-    def test_missing_exponent_no_anomaly(self):
+    def test_missing_exponent_no_anomaly(self, pp):
         """Test no anomaly when exponent is missing."""
-        df = pd.DataFrame({
-            'DEPTH': [1000.0],
-            'Mud Weight In kg/m3': [1200.0],
-            'Corrected Drilling Exponent unitless': [np.nan]
-        })
-        pp = compute_pore_pressure(df)
-        assert np.isfinite(pp[0])
+        assert np.isfinite(pp[6])
+
+
+@pytest.fixture(scope="module")
+def computed(full_df):
+    """Run the full pipeline once; the targets tests reuse base and result.
+
+    Three of the four tests only need a target-free input frame or a
+    frame with targets already attached — both fall out of a single
+    inplace=False run instead of each test paying for the whole
+    porosity/fluid/pressure pipeline again.
+    """
+    base = full_df.iloc[:2].drop(columns=['PHI_COMBINED'])
+    return {'base': base, 'result': compute_all_targets(base, inplace=False)}
 
 
 class TestComputeAllTargets:
     """Test all-targets computation."""
 
-    def test_compute_all_targets_inplace(self):
+    def test_compute_all_targets_inplace(self, computed):
         """Test that compute_all_targets modifies DataFrame in place."""
-        df = pd.DataFrame({
-            'DEPTH': [2000.0, 2100.0],
-            'Bulk Density - Compensated kg/m3': [2200.0, 2250.0],
-            'Neutron Porosity (Sandstone) Euc': [0.2, 0.25],
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [50.0, 60.0],
-            'Chrom 1 Total Gas Euc': [10.0, 15.0],
-            'Mud Weight In kg/m3': [1200.0, 1200.0],
-            'Corrected Drilling Exponent unitless': [1.0, 1.0]
-        })
+        df = computed['base'].copy()
         result = compute_all_targets(df, inplace=True)
         assert result is df  # Same object
         assert 'PHI_COMBINED' in df.columns
         assert 'FLUID_CLASS' in df.columns
         assert 'PREDICTED_PORE_PRESSURE_PSI' in df.columns
 
-    def test_compute_all_targets_copy(self):
+    def test_compute_all_targets_copy(self, computed):
         """Test that compute_all_targets respects inplace=False."""
-        df = pd.DataFrame({
-            'DEPTH': [2000.0],
-            'Bulk Density - Compensated kg/m3': [2200.0],
-            'Neutron Porosity (Sandstone) Euc': [0.2],
-            'Resistivity Phase - Corrected - 2MHz ohm.m': [50.0],
-            'Chrom 1 Total Gas Euc': [10.0],
-            'Mud Weight In kg/m3': [1200.0],
-            'Corrected Drilling Exponent unitless': [1.0]
-        })
-        result = compute_all_targets(df, inplace=False)
-        assert result is not df  # Different object
-        assert 'PHI_COMBINED' not in df.columns  # Original unchanged
-        assert 'PHI_COMBINED' in result.columns  # Copy has targets
+        # The fixture ran with inplace=False; its input must be untouched
+        assert computed['result'] is not computed['base']
+        assert 'PHI_COMBINED' not in computed['base'].columns
+        assert 'PHI_COMBINED' in computed['result'].columns
 
-    def test_skip_existing_targets(self):
+    def test_skip_existing_targets(self, computed):
         """Test that existing target columns are not recomputed."""
-        df = pd.DataFrame({
-            'DEPTH': [2000.0],
-            'PHI_COMBINED': [0.3],  # Pre-existing
-            'FLUID_CLASS': ['Pay Zone'],
-            'PREDICTED_PORE_PRESSURE_PSI': [5000.0]
-        })
-        original_phi = df['PHI_COMBINED'].copy()
+        # Targets present but raw logs dropped: recomputation would yield
+        # different (NaN) values, so unchanged means skipped
+        df = computed['result'][
+            ['DEPTH', 'PHI_COMBINED', 'FLUID_CLASS', 'PREDICTED_PORE_PRESSURE_PSI']
+        ].copy()
+        # Snapshot values only; a Series .copy() would duplicate the index
+        original_phi = df['PHI_COMBINED'].to_numpy(copy=True)
         compute_all_targets(df, inplace=True)
-        assert (df['PHI_COMBINED'] == original_phi).all()
+        assert np.array_equal(df['PHI_COMBINED'].to_numpy(), original_phi)
 
-    def test_robust_to_missing_columns(self):
+    def test_robust_to_missing_columns(self, full_df):
         """Test that function handles minimal input gracefully."""
-        df = pd.DataFrame({
-            'DEPTH': [2000.0]
-            # All other columns missing
-        })
+        # All columns other than DEPTH missing
+        df = full_df[['DEPTH']].iloc[[0]]
         result = compute_all_targets(df, inplace=False)
         # Should have NaN for targets, not crash
         assert 'PHI_COMBINED' in result.columns
         assert 'FLUID_CLASS' in result.columns
         assert 'PREDICTED_PORE_PRESSURE_PSI' in result.columns
+
+    def test_large_input_stays_vectorized(self, monkeypatch):
+        """Test the full pipeline stays array-based on a 100k-row frame.
+
+        The unit tests feed 1-7 rows, so a regression into per-row
+        Python work would pass unnoticed. Rather than a wall-clock
+        ceiling (flaky under xdist core contention), the row-wise pandas
+        entry points are stubbed to raise, so any df.apply/iterrows/
+        itertuples sneaking into the pipeline fails deterministically.
+        """
+        def _forbid(name):
+            def _raise(*args, **kwargs):
+                raise AssertionError(f"row-wise {name} called in targets pipeline")
+            return _raise
+
+        for name in ("apply", "iterrows", "itertuples"):
+            monkeypatch.setattr(pd.DataFrame, name, _forbid(f"DataFrame.{name}"))
+        monkeypatch.setattr(pd.Series, "apply", _forbid("Series.apply"))
+
+        n = 100_000
+        rng = np.random.default_rng(0)
+        df = _mk({
+            'DEPTH': np.linspace(1000.0, 4000.0, n),
+            _RHOB: rng.uniform(2000.0, 2600.0, n),
+            _NPHI: rng.uniform(0.05, 0.35, n),
+            _RES: rng.uniform(1.0, 200.0, n),
+            _GAS: rng.uniform(0.0, 120.0, n),
+            _MW: rng.uniform(1000.0, 1400.0, n),
+            _DXC: rng.uniform(0.5, 2.0, n),
+        })
+        result = compute_all_targets(df, inplace=False)
+        assert len(result) == n
+        assert np.isfinite(result['PHI_COMBINED']).all()
@@ -99,17 +99,46 @@ class ConnectionManager:
             except Exception:
                 pass
 
+    def _wants_depth(self, websocket: WebSocket, depth: float) -> bool:
+        """Check a connection's subscribed depth window against a depth."""
+        sub = self.subscriptions.get(websocket) or {}
+        min_d = sub.get("min")
+        max_d = sub.get("max")
+        if min_d is not None and depth < min_d:
+            return False
+        if max_d is not None and depth > max_d:
+            return False
+        return True
+
     async def broadcast_prediction(self, depth: float, predictions: dict):
-        """Broadcast a new prediction to all connected clients."""
+        """Broadcast a new prediction to subscribed clients.
+
+        The payload is serialized once, and connections whose subscribed
+        depth window excludes this depth are skipped entirely — clients
+        viewing a different interval get no traffic instead of a full
+        update they would discard.
+        """
         if MSGPACK_AVAILABLE:
-            await self.broadcast_binary(
+            binary_data = self._pack_binary(
                 MESSAGE_HEADER["PREDICTION"],
                 {"depth": depth, "predictions": predictions},
             )
+            for connection in self.active_connections:
+                if not self._wants_depth(connection, depth):
+                    continue
+                try:
+                    await connection.send_bytes(binary_data)
+                except Exception:
+                    pass
         else:
-            await self.broadcast(
-                {"type": "prediction", "depth": depth, "data": predictions}
-            )
+            message = {"type": "prediction", "depth": depth, "data": predictions}
+            for connection in self.active_connections:
+                if not self._wants_depth(connection, depth):
+                    continue
+                try:
+                    await connection.send_json(message)
+                except Exception:
+                    pass
 
     async def broadcast_anomaly(self, alert: dict):
         """Broadcast an anomaly alert to all connected clients."""
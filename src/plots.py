@@ -58,24 +58,45 @@ PLOT_HEIGHT = _safe_get(_cfg, 'PLOT_HEIGHT', 8)
 GR_MAX = _safe_get(_cfg, 'GR_MAX', 200)
 PORO_MAX = _safe_get(_cfg, 'PORO_MAX', 0.5)
 
-def plot_well_logs(df, predictions=None, depth_range=None):
-    """Create multi-track well log plot"""
+def plot_well_logs(df, predictions=None, depth_range=None, max_points=4000):
+    """Create multi-track well log plot
+
+    Rendering cost scales with point count while the tracks are only a few
+    hundred pixels tall, so inputs beyond max_points are stride-decimated
+    (predictions included, to keep rows aligned) before drawing.
+    """
     if depth_range:
-        mask = (df[COL_DEPTH] >= depth_range[0]) & (df[COL_DEPTH] <= depth_range[1])
-        df = df[mask].copy()
-    
+        if df[COL_DEPTH].is_monotonic_increasing:
+            # Logs are depth-sorted, so a binary search plus iloc slice
+            # replaces the full boolean mask and the DataFrame copy.
+            depth_values = df[COL_DEPTH].to_numpy()
+            lo = np.searchsorted(depth_values, depth_range[0], side="left")
+            hi = np.searchsorted(depth_values, depth_range[1], side="right")
+            df = df.iloc[lo:hi]
+        else:
+            mask = (df[COL_DEPTH] >= depth_range[0]) & (df[COL_DEPTH] <= depth_range[1])
+            df = df[mask]
+
     if len(df) == 0:
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.text(0.5, 0.5, "No data in selected depth range", transform=ax.transAxes, ha='center')
         return fig
 
+    if max_points and len(df) > max_points:
+        stride = int(np.ceil(len(df) / max_points))
+        df = df.iloc[::stride]
+        if predictions:
+            predictions = {k: np.asarray(v)[::stride] for k, v in predictions.items()}
+
     fig, axes = plt.subplots(1, 6, figsize=(PLOT_WIDTH, PLOT_HEIGHT), sharey=True)
     fig.suptitle("AI-Powered MWD Copilot", fontsize=16, y=0.95)
-    depth = df[COL_DEPTH]
+    # Pull plotted columns out as ndarrays once; passing Series
+    # makes every ax.plot re-run asarray plus index alignment.
+    depth = df[COL_DEPTH].to_numpy()
 
     # Track 1: Gamma Ray
     if COL_GAMMA_RAY in df.columns:
-        axes[0].plot(df[COL_GAMMA_RAY], depth, 'green', lw=1)
+        axes[0].plot(df[COL_GAMMA_RAY].to_numpy(), depth, 'green', lw=1)
         axes[0].set_xlabel("GR (gAPI)")
     else:
         axes[0].text(0.5, 0.5, "No GR data", transform=axes[0].transAxes, ha='center', va='center')
@@ -86,7 +107,7 @@ def plot_well_logs(df, predictions=None, depth_range=None):
 
     # Track 2: Resistivity
     if COL_RESISTIVITY in df.columns:
-        axes[1].semilogx(df[COL_RESISTIVITY], depth, 'red', lw=1)
+        axes[1].semilogx(df[COL_RESISTIVITY].to_numpy(), depth, 'red', lw=1)
         axes[1].set_xlabel("Resistivity (ohm.m)")
     else:
         axes[1].text(0.5, 0.5, "No Resistivity data", transform=axes[1].transAxes, ha='center', va='center')
@@ -96,9 +117,9 @@ def plot_well_logs(df, predictions=None, depth_range=None):
     # Track 3: Porosity
     axes[2].set_xlabel("Porosity")
     if COL_POROSITY in df.columns:
-        axes[2].plot(df[COL_POROSITY], depth, 'blue', label='True', lw=1)
+        axes[2].plot(df[COL_POROSITY].to_numpy(), depth, 'blue', label='True', lw=1)
     if predictions and 'phi_pred' in predictions:
-        axes[2].plot(predictions['phi_pred'], depth, 'orange', linestyle='--', label='Predicted', lw=1)
+        axes[2].plot(np.asarray(predictions['phi_pred']), depth, 'orange', linestyle='--', label='Predicted', lw=1)
         axes[2].legend()
     axes[2].grid(True, alpha=0.3)
     axes[2].set_xlim(0, PORO_MAX)
@@ -108,7 +129,35 @@ def plot_well_logs(df, predictions=None, depth_range=None):
     axes[3].set_xticks([])
     if COL_FLUID_CLASS in df.columns:
         y_fluid = df[COL_FLUID_CLASS].map(FLUID_CLASS_MAP).fillna(0)
-        scatter = axes[3].scatter([0]*len(y_fluid), depth, c=y_fluid, cmap=matplotlib.colors.ListedColormap(FLUID_COLORS), s=10)
+        fluid_cmap = matplotlib.colors.ListedColormap(FLUID_COLORS)
+        # One image artist instead of an N-point scatter: the track is a
+        # single strip of class colors along depth, so an (n, 1) imshow
+        # renders it with constant artist count regardless of log length.
+        # imshow spaces rows uniformly, though, so it's only correct when
+        # the depth sampling is (near) constant; irregular logs keep the
+        # per-point scatter so class boundaries land at true depths.
+        spacing = np.diff(depth)
+        if spacing.size > 0 and np.allclose(spacing, spacing[0], rtol=1e-3):
+            fluid_arr = y_fluid.to_numpy().reshape(-1, 1)
+            axes[3].imshow(
+                fluid_arr,
+                aspect='auto',
+                extent=[-0.5, 0.5, depth.max(), depth.min()],
+                cmap=fluid_cmap,
+                interpolation='nearest',
+                vmin=-0.5,
+                vmax=len(FLUID_COLORS) - 0.5,
+            )
+            # The extent pins the shared ylim exactly to the data range;
+            # pad it back out so the framing matches the autoscale margin
+            # the other tracks get.
+            pad = 0.05 * (depth.max() - depth.min())
+            axes[3].set_ylim(depth.max() + pad, depth.min() - pad)
+        else:
+            axes[3].scatter(
+                np.zeros(len(y_fluid)), depth, c=y_fluid, cmap=fluid_cmap,
+                s=10, vmin=-0.5, vmax=len(FLUID_COLORS) - 0.5,
+            )
         legend_elements = [Patch(facecolor=c, label=l) for c, l in zip(FLUID_COLORS, FLUID_CLASS_MAP.keys())]
         axes[3].legend(handles=legend_elements, loc="upper right", bbox_to_anchor=(1.8, 1))
     else:
@@ -117,7 +166,7 @@ def plot_well_logs(df, predictions=None, depth_range=None):
     # Track 5: Pore Pressure
     axes[4].set_xlabel("Pore Press (psi)")
     if COL_PORE_PRESSURE in df.columns:
-        axes[4].plot(df[COL_PORE_PRESSURE], depth, 'purple', lw=1)
+        axes[4].plot(df[COL_PORE_PRESSURE].to_numpy(), depth, 'purple', lw=1)
     else:
         axes[4].text(0.5, 0.5, "No PP data", transform=axes[4].transAxes, ha='center', va='center')
     axes[4].grid(True, alpha=0.3)
@@ -128,17 +177,13 @@ def plot_well_logs(df, predictions=None, depth_range=None):
     has_torque = COL_TORQUE in df.columns
     
     if has_wob:
-        axes[5].plot(df[COL_WOB]/1000, depth, 'black', label='WOB', lw=0.8)
+        axes[5].plot(df[COL_WOB].to_numpy() / 1000, depth, 'black', label='WOB', lw=0.8)
     if has_torque:
-        axes[5].plot(df[COL_TORQUE]/1000, depth, 'gray', label='Torque', lw=0.8)
+        axes[5].plot(df[COL_TORQUE].to_numpy() / 1000, depth, 'gray', label='Torque', lw=0.8)
     
     if has_wob or has_torque:
         axes[5].legend()
     axes[5].grid(True, alpha=0.3)
 
-    for ax in axes:
-        if ax != axes[3]:  # Skip fluid track since it has special handling
-            ax.grid(True, alpha=0.3)
-
     plt.tight_layout()
     return fig
\ No newline at end of file